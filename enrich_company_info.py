@@ -18,6 +18,8 @@ from datetime import datetime, timedelta
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 
@@ -78,6 +80,21 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
 }
 
+# One keep-alive session for all Apollo calls. Retries 429/5xx with backoff
+# (honoring Retry-After); Apollo's API is POST-only so POST must be allowed.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"POST"}),
+    ),
+))
+
 
 # --- Weekly counter ---
 
@@ -156,9 +173,8 @@ def extract_domain(url):
 def search_people(company_name):
     """Search Apollo for people at a company. Returns list of people dicts."""
     try:
-        resp = requests.post(
+        resp = SESSION.post(
             APOLLO_PEOPLE_SEARCH_URL,
-            headers=HEADERS,
             json={
                 "q_organization_name": company_name,
                 "page": 1,
@@ -168,9 +184,6 @@ def search_people(company_name):
         )
         if resp.status_code == 200:
             return resp.json().get("people", [])
-        elif resp.status_code == 429:
-            print("    Rate limited, waiting 60s...")
-            time.sleep(60)
     except Exception as e:
         print(f"    People search error: {e}")
     return []
@@ -179,17 +192,13 @@ def search_people(company_name):
 def match_person(person_id):
     """Match a person by ID to reveal full contact details + org data."""
     try:
-        resp = requests.post(
+        resp = SESSION.post(
             APOLLO_PEOPLE_MATCH_URL,
-            headers=HEADERS,
             json={"id": person_id, "reveal_personal_emails": False},
             timeout=30,
         )
         if resp.status_code == 200:
             return resp.json().get("person")
-        elif resp.status_code == 429:
-            print("    Rate limited, waiting 60s...")
-            time.sleep(60)
     except Exception as e:
         print(f"    People match error: {e}")
     return None
@@ -198,9 +207,8 @@ def match_person(person_id):
 def enrich_org_by_domain(domain):
     """Enrich organization by domain. Returns org dict or None."""
     try:
-        resp = requests.post(
+        resp = SESSION.post(
             APOLLO_ORG_ENRICH_URL,
-            headers=HEADERS,
             json={"domain": domain},
             timeout=30,
         )
@@ -214,9 +222,8 @@ def enrich_org_by_domain(domain):
 def search_org_by_name(company_name):
     """Search Apollo for an org by name. Returns org dict or None."""
     try:
-        resp = requests.post(
+        resp = SESSION.post(
             APOLLO_ORG_SEARCH_URL,
-            headers=HEADERS,
             json={"q_organization_name": company_name, "page": 1, "per_page": 1},
             timeout=30,
         )
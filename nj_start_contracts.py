@@ -8,11 +8,11 @@ Exports directly to Google Sheets.
 """
 
 import argparse
-import re
+import asyncio
 import sys
-import time
 
-from playwright.sync_api import sync_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
 
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
@@ -26,6 +26,23 @@ MIN_AMOUNT = 250_000
 MIN_YEAR = 2026
 REQUEST_DELAY = 2  # seconds between vendor profile fetches
 
+# PrimeFaces results table rows, and how long to wait for them to render
+RESULT_ROWS = "#advSearchResults tr[data-ri]"
+SELECTOR_TIMEOUT = 30000  # ms
+
+# Resource types that never affect the text we scrape; aborted to speed up page
+# loads. Stylesheets stay: PROFILE_EXTRACT_JS reads innerText, which depends on
+# CSS hiding PrimeFaces dialogs and tooltips.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+# Runs inside the vendor profile page; returns only the fields we parse.
+PROFILE_EXTRACT_JS = r"""() => {
+    const text = document.body.innerText;
+    const email = text.match(/Vendor Email:\s*(\S+@\S+)/);
+    const desc = text.match(/Business Description:\s*(.+?)(?:\t|Preferred)/);
+    return {email: email ? email[1] : "", desc: desc ? desc[1] : ""};
+}"""
+
 # Construction-related categories on NJ START
 SEARCH_CATEGORIES = {
     "05": "Building Equipment, Supplies, and Services",
@@ -60,6 +77,9 @@ NAICS_FILTERS = {
     ]),
 }
 
+# Characters dropped from dollar amounts before float() ($, thousands separators, whitespace)
+AMOUNT_STRIP = str.maketrans("", "", "$, \t\n")
+
 # Google Sheets config
 SERVICE_ACCOUNT_FILE = "service-account-key.json"
 SPREADSHEET_ID = "1HQMnHzPrx0Qa4ijuaR0BcVptpiiVG7mE3Po17rvruKQ"
@@ -81,7 +101,9 @@ SHEET_HEADERS = [
 
 def parse_amount(text):
     """Parse dollar amount string like '$1,234,567.89' to float."""
-    text = text.replace("$", "").replace(",", "").strip()
+    text = text.translate(AMOUNT_STRIP)
+    if not text:
+        return 0.0
     try:
         return float(text)
     except ValueError:
@@ -98,44 +120,85 @@ def match_naics(text):
     return None, None
 
 
-def search_contracts(playwright_page, category_id):
+async def block_static_resources(route):
+    """Playwright route handler: skip images/CSS/fonts/media, load the rest."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def new_scrape_page(browser):
+    """Open a page in its own browser context with static resources blocked."""
+    context = await browser.new_context()
+    page = await context.new_page()
+    await page.route("**/*", block_static_resources)
+    return page
+
+
+async def wait_for_results(playwright_page):
+    """Block until the results table has rows. Returns False on timeout (no results)."""
+    try:
+        await playwright_page.locator(RESULT_ROWS).first.wait_for(
+            state="visible", timeout=SELECTOR_TIMEOUT,
+        )
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+async def search_contracts(playwright_page, category_id):
     """Search NJ START for contracts in a given category, return all rows."""
-    playwright_page.goto(SEARCH_URL, timeout=60000)
-    playwright_page.wait_for_load_state("networkidle")
+    await playwright_page.goto(SEARCH_URL, timeout=60000)
 
-    playwright_page.locator(
+    category_select = playwright_page.locator(
         "#contractBlanketSearchForm\\:categoryId"
-    ).select_option(category_id)
-    time.sleep(1)
+    )
+    await category_select.wait_for(state="visible", timeout=SELECTOR_TIMEOUT)
+    await category_select.select_option(category_id)
 
-    playwright_page.locator(
+    await playwright_page.locator(
         "#contractBlanketSearchForm\\:btnPoSearch"
     ).click()
-    time.sleep(5)
-    playwright_page.wait_for_load_state("networkidle")
+    if not await wait_for_results(playwright_page):
+        return []
 
     rows_data = []
     page_num = 1
 
     while True:
-        rows = playwright_page.locator("#advSearchResults tr[data-ri]")
-        row_count = rows.count()
+        rows = playwright_page.locator(RESULT_ROWS)
+        row_count = await rows.count()
 
         for i in range(row_count):
             cells = rows.nth(i).locator("td")
-            cell_count = cells.count()
+            cell_count = await cells.count()
             row = []
             for j in range(cell_count):
-                row.append(cells.nth(j).inner_text().strip())
+                row.append((await cells.nth(j).inner_text()).strip())
             rows_data.append(row)
 
         next_btn = playwright_page.locator(
             ".ui-paginator-next:not(.ui-state-disabled)"
         )
-        if next_btn.count() > 0 and page_num < 50:
-            next_btn.first.click()
-            time.sleep(2)
-            playwright_page.wait_for_load_state("networkidle")
+        if await next_btn.count() > 0 and page_num < 50:
+            # data-ri is the absolute row index, so the first row's value
+            # changes once the next page has been rendered.
+            first_ri = await rows.first.get_attribute("data-ri")
+            await next_btn.first.click()
+            try:
+                await playwright_page.wait_for_function(
+                    """ri => {
+                        const row = document.querySelector('#advSearchResults tr[data-ri]');
+                        return row !== null && row.getAttribute('data-ri') !== ri;
+                    }""",
+                    arg=first_ri,
+                    timeout=SELECTOR_TIMEOUT,
+                )
+            except PlaywrightTimeoutError:
+                # Next page never rendered; keep the rows collected so far
+                print(f"  Category {category_id}: page {page_num + 1} timed out, stopping pagination")
+                break
             page_num += 1
         else:
             break
@@ -143,7 +206,16 @@ def search_contracts(playwright_page, category_id):
     return rows_data
 
 
-def fetch_vendor_profile(playwright_page, vendor_name):
+async def search_category(browser, category_id):
+    """Run one category search in a dedicated browser context."""
+    page = await new_scrape_page(browser)
+    try:
+        return await search_contracts(page, category_id)
+    finally:
+        await page.context.close()
+
+
+async def fetch_vendor_profile(playwright_page, vendor_name):
     """Search for a vendor by name and scrape their public profile page.
     Returns dict with contact_name, phone, email, address, website.
     """
@@ -153,35 +225,33 @@ def fetch_vendor_profile(playwright_page, vendor_name):
     }
 
     try:
-        playwright_page.goto(SEARCH_URL, timeout=60000)
-        playwright_page.wait_for_load_state("networkidle")
+        await playwright_page.goto(SEARCH_URL, timeout=60000)
 
         # Switch to Vendors search
-        playwright_page.locator(
+        doc_type_select = playwright_page.locator(
             "#advancedSearchForm\\:documentTypeSelect"
-        ).select_option("VENDORS")
-        time.sleep(3)
-        playwright_page.wait_for_load_state("networkidle")
+        )
+        await doc_type_select.wait_for(state="visible", timeout=SELECTOR_TIMEOUT)
+        await doc_type_select.select_option("VENDORS")
 
-        # Fill vendor name and search
+        # Fill vendor name (field is rendered by the VENDORS ajax update) and search
         vendor_field = playwright_page.locator('input[id*="vendorName"]').first
-        vendor_field.fill(vendor_name)
+        await vendor_field.wait_for(state="visible", timeout=SELECTOR_TIMEOUT)
+        await vendor_field.fill(vendor_name)
 
-        playwright_page.locator('button:has-text("Search")').first.click()
-        time.sleep(5)
-        playwright_page.wait_for_load_state("networkidle")
+        await playwright_page.locator('button:has-text("Search")').first.click()
+        if not await wait_for_results(playwright_page):
+            return empty
 
         # Get first result's vendor link
-        vendor_rows = playwright_page.locator("#advSearchResults tr[data-ri]")
-        if vendor_rows.count() == 0:
-            return empty
+        vendor_rows = playwright_page.locator(RESULT_ROWS)
 
         # Extract from search results: Vendor ID, Name, Address, City, State, Zip, Contact, Phone
         cells = vendor_rows.first.locator("td")
-        cell_count = cells.count()
+        cell_count = await cells.count()
         search_data = []
         for j in range(cell_count):
-            search_data.append(cells.nth(j).inner_text().strip())
+            search_data.append((await cells.nth(j).inner_text()).strip())
 
         # search_data layout: [VendorID, VendorID(dup), Name, Address, City, State, Zip, Contact, Phone]
         contact_from_search = search_data[7] if len(search_data) > 7 else ""
@@ -196,7 +266,7 @@ def fetch_vendor_profile(playwright_page, vendor_name):
 
         # Navigate to vendor profile for email
         vendor_link = vendor_rows.first.locator('a[href*="vendor"]').first
-        href = vendor_link.get_attribute("href")
+        href = await vendor_link.get_attribute("href")
         if not href:
             return {
                 "contact_name": contact_from_search,
@@ -207,31 +277,20 @@ def fetch_vendor_profile(playwright_page, vendor_name):
             }
 
         full_url = f"https://www.njstart.gov{href}" if href.startswith("/") else href
-        playwright_page.goto(full_url, timeout=60000)
-        time.sleep(2)
-        playwright_page.wait_for_load_state("networkidle")
-
-        body_text = playwright_page.locator("body").inner_text()
+        await playwright_page.goto(full_url, timeout=60000)
+        await playwright_page.wait_for_load_state("domcontentloaded")
 
-        # Parse email from profile
-        email = ""
-        email_match = re.search(r"Vendor Email:\s*(\S+@\S+)", body_text)
-        if email_match:
-            email = email_match.group(1).strip()
-
-        # Parse business description
-        biz_desc = ""
-        biz_match = re.search(r"Business Description:\s*(.+?)(?:\t|Preferred)", body_text)
-        if biz_match:
-            biz_desc = biz_match.group(1).strip()
+        # Extract email + business description in the browser so only the
+        # two fields cross CDP instead of the whole profile body text.
+        profile = await playwright_page.evaluate(PROFILE_EXTRACT_JS)
 
         return {
             "contact_name": contact_from_search,
             "phone": phone_from_search,
-            "email": email,
+            "email": (profile.get("email") or "").strip(),
             "address": address_str,
             "website": "",  # not available on NJ START
-            "business_description": biz_desc,
+            "business_description": (profile.get("desc") or "").strip(),
         }
 
     except Exception as e:
@@ -239,20 +298,24 @@ def fetch_vendor_profile(playwright_page, vendor_name):
         return empty
 
 
-def scrape_all():
+async def scrape_all():
     """Main scrape pipeline: search categories -> filter -> enrich vendors -> results."""
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+
+        # Step 1: Collect contracts from all construction categories.
+        # Categories are independent, so each gets its own browser context
+        # and the searches run concurrently.
+        print(f"\nSearching {len(SEARCH_CATEGORIES)} categories concurrently...")
+        category_rows = await asyncio.gather(*(
+            search_category(browser, cat_id) for cat_id in SEARCH_CATEGORIES
+        ))
 
-        # Step 1: Collect contracts from all construction categories
         all_rows = []
-        for cat_id, cat_name in SEARCH_CATEGORIES.items():
-            print(f"\nSearching category {cat_id}: {cat_name}")
-            rows = search_contracts(page, cat_id)
+        for (cat_id, cat_name), rows in zip(SEARCH_CATEGORIES.items(), category_rows):
+            print(f"  Category {cat_id} ({cat_name}): {len(rows)} contracts")
             for row in rows:
                 all_rows.append((cat_id, cat_name, row))
-            print(f"  Found {len(rows)} contracts")
 
         print(f"\nTotal contracts across all categories: {len(all_rows)}")
 
@@ -312,21 +375,22 @@ def scrape_all():
         print(f"Matched:             {len(filtered)}")
 
         if not filtered:
-            browser.close()
+            await browser.close()
             return []
 
         # Step 3: Enrich with vendor contact info
         print(f"\nEnriching {len(filtered)} contracts with vendor profiles...")
         vendor_cache = {}
         results = []
+        page = await new_scrape_page(browser)
 
         for i, c in enumerate(filtered, 1):
             vname = c["vendor_name"]
             print(f"  [{i}/{len(filtered)}] {c['contract_num']} — {vname}")
 
             if vname not in vendor_cache:
-                vendor_cache[vname] = fetch_vendor_profile(page, vname)
-                time.sleep(REQUEST_DELAY)
+                vendor_cache[vname] = await fetch_vendor_profile(page, vname)
+                await asyncio.sleep(REQUEST_DELAY)
 
             vi = vendor_cache[vname]
 
@@ -357,7 +421,7 @@ def scrape_all():
                 "commodity_type": f"{naics_label} (NAICS {naics_code})",
             })
 
-        browser.close()
+        await browser.close()
 
     print(f"\n--- Results ---")
     print(f"Contracts with vendor info: {len(results)}")
@@ -435,13 +499,10 @@ def write_to_google_sheets(results):
         print(f"  Skipped {len(results) - len(new_results)} already-existing entries")
     results = new_results
 
+    # Header (if the sheet is empty) and data go out in a single batchUpdate
+    data = []
     if not existing:
-        sheet.values().update(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f"'{SHEET_NAME}'!A1",
-            valueInputOption="RAW",
-            body={"values": [SHEET_HEADERS]},
-        ).execute()
+        data.append({"range": f"'{SHEET_NAME}'!A1", "values": [SHEET_HEADERS]})
         start_row = 2
 
     rows = []
@@ -449,11 +510,12 @@ def write_to_google_sheets(results):
         rows.append([r.get(f, "") for f in SHEET_FIELDS])
 
     if rows:
-        sheet.values().update(
+        data.append({"range": f"'{SHEET_NAME}'!A{start_row}", "values": rows})
+
+    if data:
+        sheet.values().batchUpdate(
             spreadsheetId=SPREADSHEET_ID,
-            range=f"'{SHEET_NAME}'!A{start_row}",
-            valueInputOption="RAW",
-            body={"values": rows},
+            body={"valueInputOption": "RAW", "data": data},
         ).execute()
 
     print(f"Wrote {len(results)} rows to Google Sheet: {SHEET_NAME}")
@@ -469,7 +531,7 @@ def main():
     )
     args = parser.parse_args()
 
-    results = scrape_all()
+    results = asyncio.run(scrape_all())
     if not results:
         print("\nNo contracts matched filters "
               f"(year >= {MIN_YEAR}, amount >= ${MIN_AMOUNT:,}).")
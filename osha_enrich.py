@@ -4,17 +4,33 @@ Enriches 2026 batch only (rows 5–658).
 Adds columns R–W: Website, Contact Name, Title, Email, Phone, Company Info.
 """
 
+import asyncio
 import json
 import os
+import random
 import re
+import sqlite3
 import subprocess
 import time
+from collections import defaultdict
+from functools import lru_cache
 from urllib.parse import urlparse
 
-import requests
+import aiohttp
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 
+# orjson for the Apollo request/response bodies and the response cache;
+# both paths produce and accept bytes
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+    _loads = json.loads
+
 # --- Config ---
 SERVICE_ACCOUNT_FILE = "service-account-key.json"
 SPREADSHEET_ID = "1HQMnHzPrx0Qa4ijuaR0BcVptpiiVG7mE3Po17rvruKQ"
@@ -23,14 +39,11 @@ SHEET_NAME = "OSHA company audits"
 HEADER_ROW = 4
 DATA_START_ROW = 5
 
-# Column indices (0-based) in the sheet
-COL_COMPANY = 0   # A
-COL_WEBSITE = 17  # R
-COL_CONTACT = 18  # S
-COL_TITLE   = 19  # T
-COL_EMAIL   = 20  # U
-COL_PHONE   = 21  # V
-COL_INFO    = 22  # W
+# Sheet columns read to decide which rows still need enrichment;
+# enrichment writes R–W (Website, Contact, Title, Email, Phone, Info)
+COL_COMPANY = "A"
+COL_WEBSITE = "R"
+COL_INFO    = "W"
 
 NEW_HEADERS = ["Website", "Contact Name", "Title", "Email", "Phone", "Company Info"]
 
@@ -38,7 +51,12 @@ APOLLO_PEOPLE_SEARCH_URL = "https://api.apollo.io/v1/mixed_people/api_search"
 APOLLO_PEOPLE_MATCH_URL  = "https://api.apollo.io/v1/people/match"
 APOLLO_ORG_ENRICH_URL    = "https://api.apollo.io/v1/organizations/enrich"
 APOLLO_ORG_SEARCH_URL    = "https://api.apollo.io/v1/organizations/search"
-API_DELAY = 1.2
+API_DELAY = 1.2  # seconds each request holds its concurrency slot after responding
+API_TIMEOUT = aiohttp.ClientTimeout(total=30)
+APOLLO_CONCURRENCY = 5  # max Apollo requests in flight
+APOLLO_SEM = asyncio.Semaphore(APOLLO_CONCURRENCY)
+APOLLO_ATTEMPTS = 5  # tries per request on 429/5xx/network errors
+MAX_BACKOFF = 60     # seconds
 
 PREFERRED_TITLES = [
     "Safety Manager", "Safety Director", "HSE Manager", "EHS Manager",
@@ -50,27 +68,53 @@ PREFERRED_TITLES = [
     "Superintendent", "General Manager",
     "Vice President", "President", "CEO", "Owner",
 ]
-
-# Write results to sheet every N companies to preserve progress
-FLUSH_EVERY = 10
+PREFERRED_TITLES_LC = [t.lower() for t in PREFERRED_TITLES]
+
+# Apollo responses are cached on disk so re-runs don't re-query unchanged companies.
+# The same file checkpoints enriched rows until they've been pushed to the sheet.
+CACHE_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "osha_enrich.db")
+CACHE_TTL = 30 * 24 * 3600  # seconds
+_WS_RE = re.compile(r"\s+")
+_COMPANY_SUFFIX_RE = re.compile(
+    r"[\s,]+(?:inc|llc|l\.l\.c|corp|corporation|co|company|ltd|lp|llp)\.?$"
+)
+
+# Placeholder or address-only "company" names that Apollo can never match
+BAD_RE = re.compile(r"^(?:n/?a|unknown|none|-+|tbd)$", re.I)
+ADDRESS_RE = re.compile(r"\d{3,}\s+\w+\s+(?:st|ave|rd|blvd)\b", re.I)
+
+# Worker tasks enriching companies concurrently (Apollo calls are still
+# capped by APOLLO_CONCURRENCY)
+ENRICH_WORKERS = 10
+# Write enriched rows to the sheet every N rows, or once the oldest pending
+# row is FLUSH_MAX_AGE seconds old, to preserve progress
+FLUSH_EVERY = 50
+FLUSH_MAX_AGE = 30  # seconds
+# Max companies enriched per run
+MAX_NEW = 100
 
 
 def _load_env():
+    """Fill os.environ from .env without overriding variables already set.
+    Skipped entirely when APOLLO_API_KEY is already in the environment.
+    """
+    if os.environ.get("APOLLO_API_KEY"):
+        return
     env_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
-    if os.path.exists(env_path):
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, val = line.split("=", 1)
-                    os.environ.setdefault(key.strip(), val.strip())
+    if not os.path.exists(env_path):
+        return
+    with open(env_path) as f:
+        pairs = (
+            line.split("=", 1) for line in map(str.strip, f)
+            if line and not line.startswith("#") and "=" in line
+        )
+        env = {key.strip(): val.strip() for key, val in pairs}
+    os.environ.update({k: v for k, v in env.items() if k not in os.environ})
 
 
-_load_env()
-APOLLO_API_KEY = os.environ.get("APOLLO_API_KEY", "")
+# x-api-key is added in main() once .env has been loaded
 HEADERS = {
     "Content-Type": "application/json",
-    "x-api-key": APOLLO_API_KEY,
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
 }
 
@@ -84,17 +128,40 @@ def get_sheets_service():
 
 
 def read_2026_rows(service):
-    result = service.spreadsheets().values().get(
+    """Read only company (A), website (R) and company info (W) for the 2026 rows.
+    Returns [(company, website, info)] aligned to sheet rows from DATA_START_ROW.
+    """
+    result = service.spreadsheets().values().batchGet(
         spreadsheetId=SPREADSHEET_ID,
-        range=f"'{SHEET_NAME}'!A{DATA_START_ROW}:W",
+        ranges=[
+            f"'{SHEET_NAME}'!{col}{DATA_START_ROW}:{col}"
+            for col in (COL_COMPANY, COL_WEBSITE, COL_INFO)
+        ],
+        majorDimension="COLUMNS",
+        valueRenderOption="FORMATTED_VALUE",
     ).execute()
-    return result.get("values", [])
-
-
-def write_batch(service, updates):
-    if not updates:
+    # Column-major: each range comes back as a single flat list of cell strings
+    companies, websites, infos = (
+        (vr.get("values") or [[]])[0]
+        for vr in result.get("valueRanges", [])
+    )
+    # Trailing blank cells are omitted by the API — pad R/W to the A length
+    websites += [""] * (len(companies) - len(websites))
+    infos += [""] * (len(companies) - len(infos))
+    return list(zip(companies, websites, infos))
+
+
+def write_batch(service, row_values):
+    """Write {sheet_row: [website, contact, title, email, phone, info]} as one R:W range per row.
+    Empty values go out as None, which the Sheets API skips, so cells filled in
+    earlier (by a previous run or by hand) are left as they are.
+    """
+    if not row_values:
         return
-    batch_data = [{"range": r, "values": [[v]]} for r, v in updates]
+    batch_data = [
+        {"range": f"'{SHEET_NAME}'!R{row}:W{row}", "values": [[v or None for v in values]]}
+        for row, values in row_values.items()
+    ]
     for start in range(0, len(batch_data), 100):
         chunk = batch_data[start:start + 100]
         service.spreadsheets().values().batchUpdate(
@@ -103,6 +170,7 @@ def write_batch(service, updates):
         ).execute()
 
 
+@lru_cache(maxsize=4096)
 def extract_domain(url):
     if not url:
         return ""
@@ -115,89 +183,233 @@ def extract_domain(url):
         return ""
 
 
-def search_people(company_name):
-    try:
-        resp = requests.post(
-            APOLLO_PEOPLE_SEARCH_URL,
-            headers=HEADERS,
-            json={"q_organization_name": company_name, "page": 1, "per_page": 25},
-            timeout=30,
+def retry_delay(attempt, retry_after=None):
+    """Seconds to wait before retry number `attempt` (0-based).
+    Honors a numeric Retry-After header, else exponential backoff with jitter.
+    """
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    return min(MAX_BACKOFF, 2 ** attempt + random.random())
+
+
+class ApolloClientError(Exception):
+    """Apollo rejected a request with a non-retryable 4xx (bad key, no credits, bad payload)."""
+
+
+async def apollo_post(session, url, payload, attempts=APOLLO_ATTEMPTS):
+    """POST to Apollo with at most APOLLO_CONCURRENCY requests in flight.
+    Retries 429/5xx/network errors with backoff. Returns the JSON body on 200,
+    raises ApolloClientError on other 4xx and RuntimeError once all attempts fail.
+    """
+    last_error = ""
+    for attempt in range(attempts):
+        retry_after = None
+        try:
+            async with APOLLO_SEM:
+                try:
+                    # Content-Type is set in HEADERS
+                    async with session.post(
+                        url, data=_dumps(payload), timeout=API_TIMEOUT
+                    ) as resp:
+                        if resp.status == 200:
+                            return _loads(await resp.read())
+                        if resp.status != 429 and resp.status < 500:
+                            raise ApolloClientError(f"HTTP {resp.status}")
+                        retry_after = resp.headers.get("Retry-After")
+                        last_error = f"HTTP {resp.status}"
+                finally:
+                    # Every request holds the slot briefly, whatever its outcome,
+                    # so the request rate stays under Apollo's limit
+                    await asyncio.sleep(API_DELAY)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            last_error = str(e) or type(e).__name__
+
+        if attempt + 1 < attempts:
+            delay = retry_delay(attempt, retry_after)
+            print(f"    Apollo {last_error}, retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+
+    raise RuntimeError(f"Apollo request failed after {attempts} attempts ({last_error})")
+
+
+# --- Apollo response cache (SQLite, survives across runs) ---
+
+_cache_conn = None
+_CACHE_MISS = object()
+
+
+def get_cache():
+    global _cache_conn
+    if _cache_conn is None:
+        _cache_conn = sqlite3.connect(CACHE_DB)
+        _cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS apollo_cache "
+            "(key TEXT PRIMARY KEY, json TEXT, ts INTEGER)"
         )
-        if resp.status_code == 200:
-            return resp.json().get("people", [])
-        elif resp.status_code == 429:
-            print("    Rate limited, waiting 60s...")
-            time.sleep(60)
-            return search_people(company_name)
-    except Exception as e:
-        print(f"    People search error: {e}")
-    return []
-
-
-def match_person(person_id):
-    try:
-        resp = requests.post(
-            APOLLO_PEOPLE_MATCH_URL,
-            headers=HEADERS,
-            json={"id": person_id, "reveal_personal_emails": False},
-            timeout=30,
+        _cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS enriched "
+            "(row INTEGER PRIMARY KEY, website TEXT, contact TEXT, title TEXT, "
+            "email TEXT, phone TEXT, info TEXT, pushed INTEGER DEFAULT 0)"
         )
-        if resp.status_code == 200:
-            return resp.json().get("person")
-        elif resp.status_code == 429:
-            print("    Rate limited, waiting 60s...")
-            time.sleep(60)
-            return match_person(person_id)
-    except Exception as e:
-        print(f"    People match error: {e}")
-    return None
-
-
-def enrich_org_by_domain(domain):
-    try:
-        resp = requests.post(
-            APOLLO_ORG_ENRICH_URL,
-            headers=HEADERS,
-            json={"domain": domain},
-            timeout=30,
+    return _cache_conn
+
+
+def cache_get(key):
+    row = get_cache().execute(
+        "SELECT json, ts FROM apollo_cache WHERE key = ?", (key,)
+    ).fetchone()
+    if row and time.time() - row[1] < CACHE_TTL:
+        return _loads(row[0])
+    return _CACHE_MISS
+
+
+def cache_put(key, value):
+    conn = get_cache()
+    conn.execute(
+        "INSERT OR REPLACE INTO apollo_cache (key, json, ts) VALUES (?, ?, ?)",
+        (key, _dumps(value).decode(), int(time.time())),
+    )
+    conn.commit()
+
+
+# --- Enriched-row checkpoint (local source of truth, pushed to the sheet later) ---
+
+def checkpoint_rows(row_values):
+    """Record {sheet_row: [6 values]} locally as not yet pushed to the sheet."""
+    conn = get_cache()
+    conn.executemany(
+        "INSERT OR REPLACE INTO enriched "
+        "(row, website, contact, title, email, phone, info, pushed) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+        [(row, *values) for row, values in row_values.items()],
+    )
+    conn.commit()
+
+
+def unpushed_rows():
+    rows = get_cache().execute(
+        "SELECT row, website, contact, title, email, phone, info "
+        "FROM enriched WHERE pushed = 0 ORDER BY row"
+    ).fetchall()
+    return {row[0]: list(row[1:]) for row in rows}
+
+
+def mark_pushed(sheet_rows):
+    conn = get_cache()
+    conn.executemany(
+        "UPDATE enriched SET pushed = 1 WHERE row = ?", [(r,) for r in sheet_rows]
+    )
+    conn.commit()
+
+
+def push_checkpoint(service):
+    """Write every checkpointed row not yet on the sheet. Returns the row count."""
+    row_values = unpushed_rows()
+    if row_values:
+        write_batch(service, row_values)
+        mark_pushed(row_values)
+    return len(row_values)
+
+
+@lru_cache(maxsize=4096)
+def normalize_company(name):
+    """Cache key for a company name: lowercase, collapsed spaces, no Inc/LLC/... suffix."""
+    key = _WS_RE.sub(" ", name.strip().lower())
+    while True:
+        stripped = _COMPANY_SUFFIX_RE.sub("", key).strip()
+        if stripped == key:
+            return key
+        key = stripped
+
+
+async def cached(endpoint, key, fetch):
+    """Return the cached result for (endpoint, key), else await fetch() and cache it.
+    Only real 200 results are cached (empty ones too). A rejected request counts
+    as no result for this run but isn't stored, so fixing the key or credits
+    takes effect on the next run; other failures propagate.
+    """
+    cache_key = f"{endpoint}:{key}"
+    value = cache_get(cache_key)
+    if value is _CACHE_MISS:
+        try:
+            value = await fetch()
+        except ApolloClientError as e:
+            print(f"    Apollo {endpoint} rejected ({e}), not cached")
+            return None
+        cache_put(cache_key, value)
+    return value
+
+
+async def search_people(session, company_name):
+    async def fetch():
+        data = await apollo_post(
+            session, APOLLO_PEOPLE_SEARCH_URL,
+            {"q_organization_name": company_name, "page": 1, "per_page": 25},
+        )
+        return (data or {}).get("people", [])
+    return await cached("people_search", normalize_company(company_name), fetch)
+
+
+async def search_people_by_org(session, org_id):
+    """People at a resolved Apollo org, filtered server-side to PREFERRED_TITLES."""
+    async def fetch():
+        data = await apollo_post(
+            session, APOLLO_PEOPLE_SEARCH_URL,
+            {
+                "organization_ids": [org_id],
+                "person_titles": PREFERRED_TITLES,
+                "page": 1,
+                "per_page": 5,
+            },
         )
-        if resp.status_code == 200:
-            return resp.json().get("organization")
-    except Exception as e:
-        print(f"    Org enrich error: {e}")
-    return None
+        return (data or {}).get("people", [])
+    return await cached("people_search_org", org_id, fetch)
 
 
-def search_org_by_name(company_name):
-    try:
-        resp = requests.post(
-            APOLLO_ORG_SEARCH_URL,
-            headers=HEADERS,
-            json={"q_organization_name": company_name, "page": 1, "per_page": 1},
-            timeout=30,
+async def match_person(session, person_id):
+    async def fetch():
+        data = await apollo_post(
+            session, APOLLO_PEOPLE_MATCH_URL,
+            {"id": person_id, "reveal_personal_emails": False},
         )
-        if resp.status_code == 200:
-            orgs = resp.json().get("organizations", [])
-            if orgs:
-                return orgs[0]
-    except Exception as e:
-        print(f"    Org search error: {e}")
-    return None
+        return (data or {}).get("person")
+    return await cached("people_match", person_id, fetch)
+
+
+async def enrich_org_by_domain(session, domain):
+    async def fetch():
+        data = await apollo_post(session, APOLLO_ORG_ENRICH_URL, {"domain": domain})
+        return (data or {}).get("organization")
+    return await cached("org_enrich", domain.lower(), fetch)
+
+
+async def search_org_by_name(session, company_name):
+    async def fetch():
+        data = await apollo_post(
+            session, APOLLO_ORG_SEARCH_URL,
+            {"q_organization_name": company_name, "page": 1, "per_page": 1},
+        )
+        orgs = (data or {}).get("organizations", [])
+        return orgs[0] if orgs else None
+    return await cached("org_search", normalize_company(company_name), fetch)
 
 
 def pick_best_person(people):
     if not people:
         return None
+    no_match = len(PREFERRED_TITLES) + 1
     scored = []
     for p in people:
         title = (p.get("title") or "").lower()
         if not title:
             continue
-        best_score = len(PREFERRED_TITLES) + 1
-        for i, pref in enumerate(PREFERRED_TITLES):
-            if pref.lower() in title:
-                best_score = i
-                break
+        best_score = next(
+            (i for i, pref in enumerate(PREFERRED_TITLES_LC) if pref in title),
+            no_match,
+        )
         scored.append((best_score, p))
     if not scored:
         for p in people:
@@ -211,29 +423,21 @@ def pick_best_person(people):
 def format_info(org):
     if not org:
         return ""
-    parts = []
-    industry = org.get("industry", "")
-    if industry:
-        parts.append(industry.title())
     employees = org.get("estimated_num_employees")
-    if employees:
-        parts.append(f"{employees:,} employees")
-    revenue = org.get("annual_revenue_printed", "")
-    if revenue:
-        parts.append(f"${revenue} revenue")
+    revenue = org.get("annual_revenue_printed")
     founded = org.get("founded_year")
-    if founded:
-        parts.append(f"Est. {founded}")
-    city = org.get("city", "")
-    state = org.get("state", "")
-    if city and state:
-        parts.append(f"{city}, {state}")
-    elif state:
-        parts.append(state)
-    summary = " | ".join(parts)
+    city = org.get("city")
+    state = org.get("state")
+    summary = " | ".join(part for part in (
+        (org.get("industry") or "").title(),
+        f"{employees:,} employees" if employees else "",
+        f"${revenue} revenue" if revenue else "",
+        f"Est. {founded}" if founded else "",
+        f"{city}, {state}" if city and state else state,
+    ) if part)
     desc = (org.get("short_description", "") or "").strip()
     if len(desc) > 500:
-        desc = desc[:497] + "..."
+        desc = desc[:499] + "…"
     if summary and desc:
         return f"{summary} — {desc}"
     return summary or desc
@@ -245,6 +449,12 @@ def clean_company_name(name):
     return cleaned if cleaned else name
 
 
+def is_junk_company(name):
+    """True for placeholder names and bare street addresses — skip Apollo for these."""
+    name = clean_company_name(name)
+    return len(name) < 3 or bool(BAD_RE.match(name) or ADDRESS_RE.search(name))
+
+
 def format_website(org):
     url = org.get("website_url", "") or ""
     if not url:
@@ -254,151 +464,242 @@ def format_website(org):
     return url
 
 
+async def enrich_company(session, company):
+    """Run the Apollo lookups for one company. Returns (org, person_data)."""
+    search_name = clean_company_name(company)
+    org = None
+    person_data = None
+
+    # Step 1: Resolve the org, then search people tied to it by ID.
+    # Fall back to a fuzzy name search when the org or its people aren't found.
+    found_org = await search_org_by_name(session, search_name)
+    people = []
+    if found_org and found_org.get("id"):
+        people = await search_people_by_org(session, found_org["id"])
+    if not people:
+        people = await search_people(session, search_name)
+    if people:
+        best = pick_best_person(people)
+        if best and best.get("id"):
+            person_data = await match_person(session, best["id"])
+            if person_data:
+                org = person_data.get("organization")
+
+    # Step 2: Org enrichment if no org from person
+    if not org and found_org:
+        domain = found_org.get("primary_domain", "")
+        if domain:
+            enriched = await enrich_org_by_domain(session, domain)
+            org = enriched if enriched else found_org
+        else:
+            # No domain but org search returned data — use it directly
+            org = found_org
+
+    return org, person_data
+
+
+def build_row_values(org, person_data, stats):
+    """Turn Apollo results into the six R–W cell values.
+    Returns (values, enriched_cols); values is None when nothing was found.
+    """
+    website_url = info_text = name = title = email = phone = ""
+    enriched_cols = []
+
+    if org:
+        website_url = format_website(org)
+        if website_url:
+            stats["website"] += 1
+            enriched_cols.append("R")
+
+        info_text = format_info(org)
+        if info_text:
+            stats["info"] += 1
+    else:
+        stats["no_result"] += 1
+
+    if person_data:
+        name = person_data.get("name") or ""
+        if not name:
+            first = person_data.get("first_name", "") or ""
+            last  = person_data.get("last_name", "") or ""
+            name  = f"{first} {last}".strip()
+        title = person_data.get("title", "") or ""
+        email = person_data.get("email", "") or ""
+        for num in (person_data.get("phone_numbers") or []):
+            raw = num.get("sanitized_number") or num.get("raw_number") or ""
+            if raw:
+                phone = raw
+                break
+
+        contact_cols = [
+            col for col, val in zip("STUV", (name, title, email, phone)) if val
+        ]
+        if contact_cols:
+            stats["contact"] += 1
+            enriched_cols.extend(contact_cols)
+
+    if info_text:
+        enriched_cols.append("W")
+
+    if not enriched_cols:
+        return None, enriched_cols
+    return [website_url, name, title, email, phone, info_text], enriched_cols
+
+
+async def sheet_writer(service, flush_q):
+    """Drain flush_q in the background so Apollo fetches continue during writes.
+    The Sheets client is synchronous, so each write runs in a worker thread.
+    A None item signals shutdown.
+    """
+    while True:
+        batch = await flush_q.get()
+        if batch is None:
+            return
+        try:
+            await asyncio.to_thread(write_batch, service, batch)
+            mark_pushed(batch)
+            print(f"  [Flushed {len(batch)} rows to sheet]")
+        except Exception as e:
+            print(f"  [Flush of {len(batch)} rows failed: {e}]")
+
+
+async def enrich_rows(service, todo, stats, api_key):
+    """Enrich (company, [sheet_rows]) groups with ENRICH_WORKERS workers pulling
+    from a queue; each company's result is written to every row in its group.
+    Enriched rows are handed to a background writer every FLUSH_EVERY rows,
+    after FLUSH_MAX_AGE seconds, and at the end.
+    """
+    total = len(todo)
+    pending = {"rows": {}, "since": None, "done": 0}
+    flush_q = asyncio.Queue()
+    flush_task = asyncio.create_task(sheet_writer(service, flush_q))
+    work_q = asyncio.Queue()
+    for item in todo:
+        work_q.put_nowait(item)
+
+    def handle_result(company, sheet_rows, result):
+        pending["done"] += 1
+        prefix = f"  [{pending['done']}/{total}] {company}"
+        if isinstance(result, Exception):
+            print(f"{prefix} -> ERROR: {result}")
+            stats["no_result"] += 1
+            return
+        org, person_data = result
+        values, enriched_cols = build_row_values(org, person_data, stats)
+        if not values:
+            print(f"{prefix} -> no result")
+            return
+        row_values = {sheet_row: values for sheet_row in sheet_rows}
+        checkpoint_rows(row_values)
+        if not pending["rows"]:
+            pending["since"] = time.monotonic()
+        pending["rows"].update(row_values)
+        dupes = f" ({len(sheet_rows)} rows)" if len(sheet_rows) > 1 else ""
+        print(f"{prefix} -> cols {','.join(enriched_cols)}{dupes}")
+
+        if (
+            len(pending["rows"]) >= FLUSH_EVERY
+            or time.monotonic() - pending["since"] >= FLUSH_MAX_AGE
+        ):
+            flush_q.put_nowait(pending["rows"])
+            pending["rows"] = {}
+
+    async def worker(session):
+        while True:
+            company, sheet_rows = await work_q.get()
+            try:
+                result = await enrich_company(session, company)
+            except Exception as e:
+                result = e
+            try:
+                handle_result(company, sheet_rows, result)
+            finally:
+                work_q.task_done()
+
+    async with aiohttp.ClientSession(
+        headers={**HEADERS, "x-api-key": api_key},
+        # Pool sized to the semaphore; idle keep-alive sockets are reused across calls
+        connector=aiohttp.TCPConnector(
+            limit=APOLLO_CONCURRENCY, keepalive_timeout=30, ttl_dns_cache=300,
+        ),
+    ) as session:
+        workers = [
+            asyncio.create_task(worker(session))
+            for _ in range(min(ENRICH_WORKERS, total))
+        ]
+        await work_q.join()
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    # Final flush, then wait for the writer to drain the queue
+    if pending["rows"]:
+        flush_q.put_nowait(pending["rows"])
+    flush_q.put_nowait(None)
+    await flush_task
+
+
 def main():
-    if not APOLLO_API_KEY:
+    _load_env()
+    api_key = os.environ.get("APOLLO_API_KEY", "")
+    if not api_key:
         print("APOLLO_API_KEY not set in .env — exiting.")
         return
 
     service = get_sheets_service()
-    sheet = service.spreadsheets()
 
     # Add new column headers to row 4
     print("Adding column headers R–W to row 4...")
-    header_updates = [
-        (f"'{SHEET_NAME}'!R{HEADER_ROW}", "Website"),
-        (f"'{SHEET_NAME}'!S{HEADER_ROW}", "Contact Name"),
-        (f"'{SHEET_NAME}'!T{HEADER_ROW}", "Title"),
-        (f"'{SHEET_NAME}'!U{HEADER_ROW}", "Email"),
-        (f"'{SHEET_NAME}'!V{HEADER_ROW}", "Phone"),
-        (f"'{SHEET_NAME}'!W{HEADER_ROW}", "Company Info"),
-    ]
-    write_batch(service, header_updates)
+    write_batch(service, {HEADER_ROW: NEW_HEADERS})
     print("  Headers added.")
 
+    # Rows enriched by an earlier run that crashed before reaching the sheet
+    resumed = push_checkpoint(service)
+    if resumed:
+        print(f"  Pushed {resumed} checkpointed rows from a previous run.")
+
     # Read all 2026 rows
     rows = read_2026_rows(service)
     total = len(rows)
     print(f"2026 rows to process: {total}")
 
     stats = {"website": 0, "contact": 0, "info": 0, "no_result": 0}
-    pending_updates = []
-    processed = 0
-    newly_checked = 0
-    MAX_NEW = 100
-
-    for i, row in enumerate(rows):
-        sheet_row = DATA_START_ROW + i
-        company = row[COL_COMPANY].strip() if len(row) > COL_COMPANY else ""
-        if not company:
-            continue
-        search_name = clean_company_name(company)
 
-        # Skip if already enriched (has website or info)
-        already_website = (row[COL_WEBSITE].strip() if len(row) > COL_WEBSITE else "")
-        already_info    = (row[COL_INFO].strip()    if len(row) > COL_INFO    else "")
-        if already_website or already_info:
-            processed += 1
-            continue
-
-        if (i + 1) % 10 == 0 or i == 0:
-            print(f"\n  [{i+1}/{total}] {company}...")
-
-        org = None
-        person_data = None
-
-        # Step 1: Search for people
-        people = search_people(search_name)
-        time.sleep(API_DELAY)
-        if people:
-            best = pick_best_person(people)
-            if best and best.get("id"):
-                person_data = match_person(best["id"])
-                time.sleep(API_DELAY)
-                if person_data:
-                    org = person_data.get("organization")
-
-        # Step 2: Org enrichment if no org from person
-        if not org:
-            found_org = search_org_by_name(search_name)
-            time.sleep(API_DELAY)
-            if found_org:
-                domain = found_org.get("primary_domain", "")
-                if domain:
-                    enriched = enrich_org_by_domain(domain)
-                    time.sleep(API_DELAY)
-                    org = enriched if enriched else found_org
-                else:
-                    # No domain but org search returned data — use it directly
-                    org = found_org
-
-        # Build updates
-        enriched_cols = []
-
-        if org:
-            website_url = format_website(org)
-            if website_url:
-                pending_updates.append((f"'{SHEET_NAME}'!R{sheet_row}", website_url))
-                stats["website"] += 1
-                enriched_cols.append("R")
-
-            info_text = format_info(org)
-            if info_text:
-                pending_updates.append((f"'{SHEET_NAME}'!W{sheet_row}", info_text))
-                stats["info"] += 1
-                enriched_cols.append("W")
-        else:
-            stats["no_result"] += 1
-
-        if person_data:
-            name = person_data.get("name") or ""
-            if not name:
-                first = person_data.get("first_name", "") or ""
-                last  = person_data.get("last_name", "") or ""
-                name  = f"{first} {last}".strip()
-            title = person_data.get("title", "") or ""
-            email = person_data.get("email", "") or ""
-            phone = ""
-            for num in (person_data.get("phone_numbers") or []):
-                raw = num.get("sanitized_number") or num.get("raw_number") or ""
-                if raw:
-                    phone = raw
-                    break
-
-            if name:
-                pending_updates.append((f"'{SHEET_NAME}'!S{sheet_row}", name))
-                enriched_cols.append("S")
-            if title:
-                pending_updates.append((f"'{SHEET_NAME}'!T{sheet_row}", title))
-                enriched_cols.append("T")
-            if email:
-                pending_updates.append((f"'{SHEET_NAME}'!U{sheet_row}", email))
-                enriched_cols.append("U")
-            if phone:
-                pending_updates.append((f"'{SHEET_NAME}'!V{sheet_row}", phone))
-                enriched_cols.append("V")
-            if enriched_cols:
-                stats["contact"] += 1
-
-        if enriched_cols:
-            print(f"    {company} -> cols {','.join(enriched_cols)}")
-
-        processed += 1
-        newly_checked += 1
-
-        # Flush to sheet every FLUSH_EVERY newly-checked companies
-        if newly_checked % FLUSH_EVERY == 0 and pending_updates:
-            write_batch(service, pending_updates)
-            print(f"  [Flushed {len(pending_updates)} updates to sheet]")
-            pending_updates = []
-
-        if newly_checked >= MAX_NEW:
-            print(f"\n  Reached limit of {MAX_NEW} companies — stopping.")
-            break
-
-    # Final flush
-    if pending_updates:
-        write_batch(service, pending_updates)
-        print(f"  [Final flush: {len(pending_updates)} updates]")
+    # Skip rows with no company or already enriched (has website or info)
+    todo = [
+        (DATA_START_ROW + i, company.strip())
+        for i, (company, website, info) in enumerate(rows)
+        if company.strip() and not (website.strip() or info.strip())
+    ]
+    processed = sum(1 for company, _, _ in rows if company.strip()) - len(todo)
+
+    # Junk names count as no-result without spending any Apollo calls
+    junk = [(row, company) for row, company in todo if is_junk_company(company)]
+    if junk:
+        print(f"  Skipping {len(junk)} placeholder/address company names.")
+        todo = [(row, company) for row, company in todo if not is_junk_company(company)]
+        stats["no_result"] += len(junk)
+        processed += len(junk)
+
+    # Same company on several rows (different sites/years) -> one Apollo lookup
+    groups = defaultdict(list)
+    names = {}
+    for row, company in todo:
+        key = normalize_company(clean_company_name(company))
+        groups[key].append(row)
+        names.setdefault(key, company)
+    todo = [(names[key], sheet_rows) for key, sheet_rows in groups.items()]
+
+    if len(todo) > MAX_NEW:
+        print(f"  {len(todo)} companies need enrichment — limiting this run to {MAX_NEW}.")
+        todo = todo[:MAX_NEW]
+
+    asyncio.run(enrich_rows(service, todo, stats, api_key))
+    # Retry anything whose background flush failed
+    leftover = push_checkpoint(service)
+    if leftover:
+        print(f"  [Pushed {leftover} rows left in checkpoint]")
+    processed += sum(len(sheet_rows) for _, sheet_rows in todo)
 
     print(f"\n--- OSHA Enrichment Complete ---")
     print(f"  Processed:     {processed}")
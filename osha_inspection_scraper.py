@@ -16,19 +16,37 @@ Writes to the "OSHA company audits" sheet in the main Google Sheet.
 Rows with violations > 0 are included; sorted by violations descending.
 """
 
+import asyncio
+import os
 import re
+import sqlite3
 import ssl
 import sys
+import threading
 import time
 import html as html_lib
+import itertools
+import operator
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import aiohttp
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
+from googleapiclient.model import JsonModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # --- Config ---
 OSHA_BASE = "https://www.osha.gov/ords/imis"
@@ -48,7 +66,18 @@ REQUEST_DELAY = 1.0  # seconds between pages
 
 # Whether to fetch detail pages for city/address (slower but richer data)
 FETCH_DETAILS = True
-DETAIL_DELAY = 0.5  # seconds between detail page fetches
+DETAIL_TIMEOUT = aiohttp.ClientTimeout(total=30)
+OSHA_CONCURRENCY = 6   # max detail requests in flight to osha.gov
+DETAIL_ATTEMPTS = 4    # tries per detail page on 429/503
+PROGRESS_EVERY = 25    # print detail progress every N pages (errors print immediately)
+
+# Detail pages are static once fetched — cache their HTML on disk by activity_nr
+DETAIL_CACHE_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "osha_cache.sqlite")
+DETAIL_CACHE_TTL = 7 * 24 * 3600  # seconds
+
+# Larger responses are dropped unparsed — a misrouted or malformed page
+# would make the .*? patterns go quadratic (OSHA pages are ~200 KB)
+MAX_PAGE_BYTES = 4_000_000
 
 # Google Sheets config
 SERVICE_ACCOUNT_FILE = "service-account-key.json"
@@ -60,10 +89,62 @@ SHEET_NAME = "OSHA company audits"
 
 HEADERS = {"User-Agent": "OSHA-Research-Scraper/1.0"}
 
+# Keep-alive session for search pages; retries network errors and 429/5xx
+# with backoff (1.5s, 3s, 6s)
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+))
+# NAICS codes are scraped in parallel threads; cap concurrent search requests
+SEARCH_SEM = threading.BoundedSemaphore(6)
+
+# Precompiled patterns for the search-results and detail-page parsers
+_WS_RE = re.compile(r'\s+')
+_TAG_RE = re.compile(r'<[^>]+>')
+# One pass over entities and runs of tags/whitespace (see clean_html_text)
+_CLEANUP_RE = re.compile(r'&#?\w+;|(?:<[^>]+>|\s)+')
+_NEXT_PAGE_RE = re.compile(r'p_direction=Next', re.IGNORECASE)
+_ADDR_RE = re.compile(r'<strong>Site Address</strong>\s*:.*?<br>(.*?)</p>', re.DOTALL | re.IGNORECASE)
+_BR_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+_CITY_RE = re.compile(r'^(.+?),\s*[A-Z]{2}\s+\d{5}')
+_THTD_RE = re.compile(r'<th[^>]*>\s*(.*?)\s*</th>\s*<td[^>]*>(.*?)</td>', re.DOTALL | re.IGNORECASE)
+_VIOL_TYPE_RE = re.compile(r'<td[^>]*>\s*(Serious|Willful|Repeat|Other)\s*</td>', re.IGNORECASE)
+
+# str.translate tables for parse_money and th/td key normalization
+_MONEY_TRANS = str.maketrans('', '', ',$')
+_KEY_TRANS = str.maketrans(' ', '_')
+
+
+def _cleanup_repl(m):
+    s = m.group(0)
+    if s[0] == '&':
+        return html_lib.unescape(s)
+    # A run of tags and whitespace: tags vanish, any whitespace in it becomes
+    # one space ("$1,<b>000</b>" -> "$1,000", "Foo <b>Bar</b>" -> "Foo Bar")
+    return ' ' if _TAG_RE.sub('', s) else ''
+
+
+def clean_html_text(fragment):
+    """Strip tags, decode entities and collapse whitespace in a single regex pass."""
+    # Most cells (dates, codes, money) have no markup or entities — skip the
+    # Python-level callback entirely for those
+    if "&" not in fragment and "<" not in fragment:
+        return _WS_RE.sub(" ", fragment).strip()
+    return _CLEANUP_RE.sub(_cleanup_repl, fragment).strip()
+
 
 def search_osha_page(naics, start_month, start_day, start_year,
                      end_month, end_day, end_year, page_offset=0):
-    """Fetch one page of OSHA industry search results."""
+    """Fetch one page of OSHA industry search results.
+    Returns None when the page has no inspection rows.
+    """
     params = {
         "naics": naics,
         "State": "",
@@ -85,14 +166,35 @@ def search_osha_page(naics, start_month, start_day, start_year,
         "p_direction": "Next" if page_offset > 0 else "",
         "p_show": str(PAGE_SIZE),
     }
-    resp = requests.get(
-        f"{OSHA_BASE}/industry.search",
-        params=params,
-        headers=HEADERS,
-        timeout=60,
-    )
-    resp.raise_for_status()
-    return resp.text
+    with SEARCH_SEM:
+        resp = SESSION.get(
+            f"{OSHA_BASE}/industry.search",
+            params=params,
+            timeout=60,
+            stream=True,
+        )
+        with resp:
+            resp.raise_for_status()
+            body = read_capped(resp)
+    if body is None:
+        print(f"  [{naics}] search page over {MAX_PAGE_BYTES:,} bytes, skipped")
+        return None
+    # Trailing empty pages have no detail links — skip decoding them at all
+    if b"inspection_detail" not in body:
+        return None
+    return body.decode(resp.encoding or "utf-8", "replace")
+
+
+def read_capped(resp):
+    """Read a streamed response body, or None once it passes MAX_PAGE_BYTES."""
+    chunks = []
+    size = 0
+    for chunk in resp.iter_content(65536):
+        size += len(chunk)
+        if size > MAX_PAGE_BYTES:
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
 
 
 def parse_search_results(html):
@@ -100,36 +202,34 @@ def parse_search_results(html):
     results = []
 
     # Find the results table (second table in the page)
-    tables = re.findall(r'<table[^>]*>(.*?)</table>', html, re.DOTALL | re.IGNORECASE)
+    tables = LexborHTMLParser(html).css("table")
     if len(tables) < 2:
         return results, False  # (results, has_more)
 
-    table = tables[1]
-    rows = re.findall(r'<tr[^>]*>(.*?)</tr>', table, re.DOTALL | re.IGNORECASE)
+    rows = iter(tables[1].css("tr"))
+    next(rows, None)  # Skip header row
 
-    for row in rows[1:]:  # Skip header row
-        cells = re.findall(r'<t[dh][^>]*>(.*?)</t[dh]>', row, re.DOTALL | re.IGNORECASE)
+    for row in rows:
+        cells = [node for node in row.iter() if node.tag in ("td", "th")]
         if len(cells) < 12:
             continue
 
-        def cell(i):
-            return html_lib.unescape(
-                re.sub(r'\s+', ' ', re.sub(r'<[^>]+>', ' ', cells[i])).strip()
-            )
+        # Entities are already decoded by the parser; collapse whitespace only
+        text = [_WS_RE.sub(" ", c.text(separator=" ")).strip() for c in cells]
 
-        num = cell(1)
-        activity_nr = cell(2)
-        date_opened = cell(3)
-        naics_code = cell(9)
-        violations_raw = cell(10)
-        estab_name = cell(11)
-        insp_type = cell(6)
-        insp_scope = cell(7)
-        state = cell(5)
+        activity_nr = text[2]
+        date_opened = text[3]
+        naics_code = text[9]
+        violations_raw = text[10]
+        estab_name = text[11]
+        insp_type = text[6]
+        insp_scope = text[7]
+        state = text[5]
 
         # Extract link from 3rd cell (activity number link)
-        link_match = re.search(r'href="([^"]*inspection_detail[^"]*)"', cells[2], re.IGNORECASE)
-        detail_link = f"{OSHA_BASE}/{link_match.group(1)}" if link_match else ""
+        link = cells[2].css_first('a[href*="inspection_detail"]')
+        href = link.attributes.get("href") if link else None
+        detail_link = f"{OSHA_BASE}/{href}" if href else ""
 
         # Parse violations
         try:
@@ -158,71 +258,136 @@ def parse_search_results(html):
         })
 
     # Check if there's a "Next" page link
-    has_more = bool(re.search(r'p_direction=Next', html, re.IGNORECASE))
+    has_more = bool(_NEXT_PAGE_RE.search(html))
     return results, has_more
 
 
-def fetch_inspection_detail(detail_url):
-    """Fetch detail page and extract city, address, and penalty data."""
-    try:
-        resp = requests.get(detail_url, headers=HEADERS, timeout=30)
-        resp.raise_for_status()
-        html = resp.text
-    except Exception as e:
-        print(f"      Detail fetch error: {e}")
-        return {}
+_detail_cache_conn = None
+
+
+def get_detail_cache():
+    global _detail_cache_conn
+    if _detail_cache_conn is None:
+        _detail_cache_conn = sqlite3.connect(DETAIL_CACHE_DB)
+        _detail_cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS detail_pages "
+            "(activity_nr TEXT PRIMARY KEY, html TEXT, ts INTEGER)"
+        )
+    return _detail_cache_conn
+
+
+def detail_cache_get(activity_nr):
+    row = get_detail_cache().execute(
+        "SELECT html, ts FROM detail_pages WHERE activity_nr = ?", (activity_nr,)
+    ).fetchone()
+    if row and time.time() - row[1] < DETAIL_CACHE_TTL:
+        return row[0]
+    return None
 
+
+def detail_cache_put(activity_nr, html):
+    conn = get_detail_cache()
+    conn.execute(
+        "INSERT OR REPLACE INTO detail_pages (activity_nr, html, ts) VALUES (?, ?, ?)",
+        (activity_nr, html, int(time.time())),
+    )
+    conn.commit()
+
+
+async def download_detail_page(session, sem, detail_url):
+    """GET a detail page. At most OSHA_CONCURRENCY requests hold `sem`;
+    429/503 responses back off exponentially (outside the semaphore) and retry.
+    Returns the HTML, or None on failure.
+    """
+    for attempt in range(DETAIL_ATTEMPTS):
+        try:
+            async with sem:
+                async with session.get(detail_url, timeout=DETAIL_TIMEOUT) as resp:
+                    if resp.status not in (429, 503):
+                        resp.raise_for_status()
+                        body = bytearray()
+                        async for chunk in resp.content.iter_chunked(65536):
+                            body += chunk
+                            if len(body) > MAX_PAGE_BYTES:
+                                print(f"      Detail page over {MAX_PAGE_BYTES:,} bytes, skipped")
+                                return None
+                        # get_encoding() raises when the response has no charset
+                        return body.decode(resp.charset or "utf-8", "replace")
+        except Exception as e:
+            print(f"      Detail fetch error: {e}")
+            return None
+        if attempt + 1 < DETAIL_ATTEMPTS:
+            await asyncio.sleep(2 ** attempt)
+    print(f"      Detail fetch error: HTTP {resp.status} after {DETAIL_ATTEMPTS} attempts")
+    return None
+
+
+async def fetch_inspection_detail(session, sem, insp, use_cache=True, only_address=False):
+    """Fetch detail page (from the disk cache when possible) and extract
+    city, address, and penalty data (city/address only if only_address).
+    """
+    activity_nr = insp["activity_nr"]
+    html = detail_cache_get(activity_nr) if use_cache else None
+    if html is None:
+        html = await download_detail_page(session, sem, insp["detail_link"])
+        if html is None:
+            return {}
+        if use_cache:
+            detail_cache_put(activity_nr, html)
+    return parse_inspection_detail(html, only_address)
+
+
+def parse_inspection_detail(html, only_address=False):
+    """Extract city, address, and penalty data from a detail page.
+    only_address skips the penalty/citation scans (2026 pages have no citations yet).
+    """
     def extract(pattern):
         m = re.search(pattern, html, re.IGNORECASE | re.DOTALL)
         if not m:
             return ""
-        return html_lib.unescape(re.sub(r'<[^>]+>', '', m.group(1)).strip())
+        return clean_html_text(m.group(1))
 
     # Parse city and street from the Site Address block:
     # <p><strong>Site Address</strong>: <br> Name<br> Street<br>City, ST Zip</p>
     city = ""
     address = ""
-    addr_match = re.search(
-        r'<strong>Site Address</strong>\s*:.*?<br>(.*?)</p>',
-        html, re.DOTALL | re.IGNORECASE
-    )
+    addr_match = _ADDR_RE.search(html)
     if addr_match:
         lines = [
-            html_lib.unescape(re.sub(r'<[^>]+>', '', part).strip())
-            for part in re.split(r'<br\s*/?>', addr_match.group(1), flags=re.IGNORECASE)
+            clean_html_text(part)
+            for part in _BR_RE.split(addr_match.group(1))
         ]
         lines = [l for l in lines if l]
         if lines:
             city_state_zip = lines[-1]  # e.g. "Bloomington, IN 47403"
-            city_m = re.match(r'^(.+?),\s*[A-Z]{2}\s+\d{5}', city_state_zip)
+            city_m = _CITY_RE.match(city_state_zip)
             city = city_m.group(1) if city_m else city_state_zip
             if len(lines) >= 2:
                 address = lines[-2]  # street line (skip company name at lines[0])
 
+    if only_address:
+        return {"city": city, "address": address}
+
     # Extract th->td pairs for penalty data
     data = {}
-    pairs = re.findall(
-        r'<th[^>]*>\s*(.*?)\s*</th>\s*<td[^>]*>(.*?)</td>',
-        html, re.DOTALL | re.IGNORECASE
-    )
-    for k, v in pairs:
-        key = re.sub(r'<[^>]+>', '', k).strip().lower().replace(' ', '_').rstrip(':')
-        val = html_lib.unescape(re.sub(r'<[^>]+>', '', v).strip())
+    for k, v in (m.groups() for m in _THTD_RE.finditer(html)):
+        key = clean_html_text(k).lower().translate(_KEY_TRANS).rstrip(':')
+        val = clean_html_text(v)
         if key and val and val != '&nbsp;':
             data[key] = val
 
     def parse_money(s):
-        s = re.sub(r'[,$]', '', s or "0")
+        s = (s or "0").translate(_MONEY_TRANS)
         try:
             return float(s)
         except ValueError:
             return 0.0
 
-    # Count violation types from citation table
-    viol_types = re.findall(r'<td[^>]*>\s*(Serious|Willful|Repeat|Other)\s*</td>', html, re.IGNORECASE)
-    serious = sum(1 for v in viol_types if v.lower() == 'serious')
-    willful = sum(1 for v in viol_types if v.lower() == 'willful')
-    repeat = sum(1 for v in viol_types if v.lower() == 'repeat')
+    # Count violation types from citation table in one streaming pass
+    viol_counts = Counter(m.group(1).lower() for m in _VIOL_TYPE_RE.finditer(html))
+    serious = viol_counts['serious']
+    willful = viol_counts['willful']
+    repeat = viol_counts['repeat']
 
     return {
         "city": city,
@@ -238,28 +403,21 @@ def fetch_inspection_detail(detail_url):
 def scrape_naics(naics_code, naics_label, year, min_violations=0):
     """Scrape all inspections for one NAICS code for a single year."""
     all_inspections = []
-    print(f"  [{naics_code}] {year}...", end="", flush=True)
     page_offset = 0
 
     while True:
-        # Retry up to 3 times with backoff on network errors
-        html = None
-        for attempt in range(3):
-            try:
-                html = search_osha_page(
-                    naics=naics_code,
-                    start_month=1, start_day=1, start_year=year,
-                    end_month=12, end_day=31, end_year=year,
-                    page_offset=page_offset,
-                )
-                break
-            except Exception as e:
-                if attempt < 2:
-                    wait = (attempt + 1) * 5
-                    print(f" [retry {attempt+1} in {wait}s]", end="", flush=True)
-                    time.sleep(wait)
-                else:
-                    print(f" ERROR: {e}")
+        # SESSION retries transient failures; anything raised here is final
+        try:
+            html = search_osha_page(
+                naics=naics_code,
+                start_month=1, start_day=1, start_year=year,
+                end_month=12, end_day=31, end_year=year,
+                page_offset=page_offset,
+            )
+        except Exception as e:
+            print(f"  [{naics_code}] {year} ERROR: {e}")
+            break
+        # None = empty page (end of results)
         if html is None:
             break
 
@@ -280,27 +438,58 @@ def scrape_naics(naics_code, naics_label, year, min_violations=0):
         page_offset += PAGE_SIZE
 
     label = "all inspections" if min_violations == 0 else "with violations"
-    print(f" {len(all_inspections)} {label}.")
+    print(f"  [{naics_code}] {year}: {len(all_inspections)} {label}.")
     return all_inspections
 
 
 # --- Detail page enrichment ---
 
-def enrich_with_details(inspections):
-    """Fetch inspection detail pages to add city, address, penalty data."""
-    total = len(inspections)
-    print(f"\nFetching detail pages for {total} inspections...")
-
-    for i, insp in enumerate(inspections, 1):
-        if not insp.get("detail_link"):
-            continue
+async def fetch_details(inspections, use_cache=True, only_address=False):
+    """Fetch detail pages with OSHA_CONCURRENCY workers pulling from a queue."""
+    targets = [insp for insp in inspections if insp.get("detail_link")]
+    total = len(targets)
+    queue = asyncio.Queue()
+    for insp in targets:
+        queue.put_nowait(insp)
+    sem = asyncio.Semaphore(OSHA_CONCURRENCY)
+    done = 0
+
+    async def worker(session):
+        nonlocal done
+        while True:
+            insp = await queue.get()
+            try:
+                detail = await fetch_inspection_detail(
+                    session, sem, insp, use_cache, only_address
+                )
+                insp.update(detail)
+                done += 1
+                if done % PROGRESS_EVERY == 0 or done == total:
+                    print(f"  [{done}/{total}] detail pages fetched"
+                          f" (last: {insp['estab_name'][:40]}, city={detail.get('city', '?')})")
+            except Exception as e:
+                # Keep the worker alive: a dead worker would leave its share
+                # of the queue unprocessed and queue.join() waiting forever
+                print(f"      Detail error for activity {insp['activity_nr']}: {e}")
+            finally:
+                queue.task_done()
+
+    connector = aiohttp.TCPConnector(limit_per_host=OSHA_CONCURRENCY, keepalive_timeout=30)
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+        workers = [
+            asyncio.create_task(worker(session))
+            for _ in range(min(OSHA_CONCURRENCY, total))
+        ]
+        await queue.join()
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
 
-        print(f"  [{i}/{total}] {insp['estab_name'][:50]}...", end="", flush=True)
-        detail = fetch_inspection_detail(insp["detail_link"])
-        insp.update(detail)
-        print(f" city={detail.get('city', '?')} penalty=${detail.get('current_penalty', 0):,.0f}")
-        time.sleep(DETAIL_DELAY)
 
+def enrich_with_details(inspections, use_cache=True, only_address=False):
+    """Fetch inspection detail pages to add city, address, penalty data."""
+    print(f"\nFetching detail pages for {len(inspections)} inspections...")
+    asyncio.run(fetch_details(inspections, use_cache, only_address))
     return inspections
 
 
@@ -314,6 +503,9 @@ SHEET_FIELDS = [
     "initial_penalty", "current_penalty",
     "priority", "detail_link",
 ]
+# Every record carries all SHEET_FIELDS keys (parse_search_results +
+# collect_and_process), so rows can be fetched with one C-level itemgetter
+_sheet_row = operator.itemgetter(*SHEET_FIELDS)
 
 SHEET_HEADERS = [
     "Company", "City", "State", "Address",
@@ -326,33 +518,59 @@ SHEET_HEADERS = [
 
 
 def compute_priority(r):
-    if r.get("willful", 0) > 0 or r.get("repeat", 0) > 0:
+    # Records always carry these keys (defaults set in parse_search_results)
+    willful, repeat, serious, violations = (
+        r["willful"], r["repeat"], r["serious"], r["violations"]
+    )
+    if willful > 0 or repeat > 0:
         return "High"
-    elif r.get("serious", 0) > 0 or r.get("violations", 0) >= 5:
+    elif serious > 0 or violations >= 5:
         return "Medium"
-    elif r.get("violations", 0) > 0:
+    elif violations > 0:
         return "Low"
     return ""
 
 
+class OrjsonModel(JsonModel):
+    """JsonModel that encodes request bodies with orjson (large values payloads)."""
+
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and "data" not in body_value and self._data_wrapper:
+            body_value = {"data": body_value}
+        return orjson.dumps(body_value).decode()
+
+
 def get_sheets_service():
     creds = service_account.Credentials.from_service_account_file(
         SERVICE_ACCOUNT_FILE,
         scopes=["https://www.googleapis.com/auth/spreadsheets"],
     )
-    return build("sheets", "v4", credentials=creds)
+    # Fall back to the client's stdlib-json model when orjson isn't installed
+    model = OrjsonModel() if orjson else None
+    return build("sheets", "v4", credentials=creds, model=model)
 
 
 def ensure_sheet_exists(service):
+    """Return the tab's properties (sheetId, gridProperties), creating it if needed."""
     spreadsheet = service.spreadsheets().get(spreadsheetId=SPREADSHEET_ID).execute()
     for s in spreadsheet.get("sheets", []):
         if s["properties"]["title"] == SHEET_NAME:
-            return
-    service.spreadsheets().batchUpdate(
+            return s["properties"]
+    reply = service.spreadsheets().batchUpdate(
         spreadsheetId=SPREADSHEET_ID,
         body={"requests": [{"addSheet": {"properties": {"title": SHEET_NAME}}}]},
     ).execute()
     print(f"Created sheet tab: {SHEET_NAME}")
+    return reply["replies"][0]["addSheet"]["properties"]
+
+
+def cell_data(value):
+    """RAW-equivalent CellData for updateCells: numbers stay numbers, "" stays empty."""
+    if value is None or value == "":
+        return {}
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return {"userEnteredValue": {"numberValue": value}}
+    return {"userEnteredValue": {"stringValue": str(value)}}
 
 
 LEGEND_ROWS = [
@@ -431,7 +649,7 @@ APOLLO_COL_START = 17
 
 def write_to_google_sheets(results_2026, results_2025):
     service = get_sheets_service()
-    ensure_sheet_exists(service)
+    props = ensure_sheet_exists(service)
     sheet = service.spreadsheets()
 
     # Preserve existing Apollo enrichment (cols R-W) before clearing
@@ -451,65 +669,66 @@ def write_to_google_sheets(results_2026, results_2025):
     except Exception as e:
         print(f"  Could not read existing Apollo data: {e}")
 
-    section_2026 = [
+    section_2026_header = [
         ["=== SECTION 1: 2026 — Fresh Leads (Currently Under Investigation) ==="],
         ["These companies were inspected in 2026. Citations have not been issued yet "
          "(OSHA takes 6-12 weeks to process). High-value outreach window — "
          "contact them before the fine arrives."],
         [],
         SHEET_HEADERS + APOLLO_HEADERS,
-    ] + [[r.get(f, "") for f in SHEET_FIELDS] for r in results_2026]
+    ]
 
-    section_2025 = [
+    section_2025_header = [
         [],
         ["=== SECTION 2: 2025 — Confirmed Violations (Citations Issued) ==="],
         ["These companies received formal OSHA citations in 2025. "
          "Sorted by number of violations. Priority column shows severity."],
         [],
         SHEET_HEADERS,
-    ] + [[r.get(f, "") for f in SHEET_FIELDS] for r in results_2025]
-
-    all_rows = section_2026 + section_2025 + LEGEND_ROWS
-
-    sheet.values().clear(
-        spreadsheetId=SPREADSHEET_ID,
-        range=f"'{SHEET_NAME}'!A1:Z10000",
-        body={},
-    ).execute()
-
-    sheet.values().update(
+    ]
+
+    # Preserved Apollo cells (R-W) ride along on their 2026 rows
+    all_rows = list(itertools.chain(
+        section_2026_header,
+        (
+            list(_sheet_row(r)) + apollo_by_company.get(r["estab_name"].strip().lower(), [])
+            for r in results_2026
+        ),
+        section_2025_header,
+        (list(_sheet_row(r)) for r in results_2025),
+        LEGEND_ROWS,
+    ))
+
+    # Clear + write in one spreadsheets.batchUpdate (requests apply in order)
+    sheet_id = props["sheetId"]
+    grid = props.get("gridProperties", {})
+    requests_body = []
+    for dimension, have, need in (
+        ("ROWS", grid.get("rowCount", 0), len(all_rows)),
+        ("COLUMNS", grid.get("columnCount", 0), max(map(len, all_rows))),
+    ):
+        if need > have:
+            requests_body.append({"appendDimension": {
+                "sheetId": sheet_id, "dimension": dimension, "length": need - have,
+            }})
+    requests_body += [
+        {"updateCells": {"range": {"sheetId": sheet_id}, "fields": "userEnteredValue"}},
+        {"updateCells": {
+            "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+            "rows": [{"values": [cell_data(v) for v in row]} for row in all_rows],
+            "fields": "userEnteredValue",
+        }},
+    ]
+    sheet.batchUpdate(
         spreadsheetId=SPREADSHEET_ID,
-        range=f"'{SHEET_NAME}'!A1",
-        valueInputOption="RAW",
-        body={"values": all_rows},
+        body={"requests": requests_body},
     ).execute()
 
-    # Restore Apollo data for 2026 rows (data starts at row 5)
     if apollo_by_company:
-        apollo_updates = []
-        data_start_row = 5  # row 1=section header, 2=desc, 3=blank, 4=headers, 5=data
-        for idx, r in enumerate(results_2026):
-            company_key = r.get("estab_name", "").strip().lower()
-            apollo = apollo_by_company.get(company_key)
-            if apollo:
-                sheet_row = data_start_row + idx
-                col_letter = "R"
-                for col_offset, value in enumerate(apollo):
-                    col = chr(ord(col_letter) + col_offset)
-                    if value and value.strip():
-                        apollo_updates.append({
-                            "range": f"'{SHEET_NAME}'!{col}{sheet_row}",
-                            "values": [[value]],
-                        })
-        if apollo_updates:
-            for start in range(0, len(apollo_updates), 100):
-                chunk = apollo_updates[start:start + 100]
-                sheet.values().batchUpdate(
-                    spreadsheetId=SPREADSHEET_ID,
-                    body={"valueInputOption": "RAW", "data": chunk},
-                ).execute()
-            restored = sum(1 for u in apollo_updates if u)
-            print(f"  Restored Apollo data: {restored} cells across {len(apollo_by_company)} companies")
+        restored = sum(
+            1 for r in results_2026 if r["estab_name"].strip().lower() in apollo_by_company
+        )
+        print(f"  Restored Apollo data for {restored} rows across {len(apollo_by_company)} companies")
 
     print(f"Wrote {len(results_2026)} rows (2026) + {len(results_2025)} rows (2025) + legend to '{SHEET_NAME}'")
 
@@ -530,39 +749,40 @@ def preview_results(results, limit=10):
         print()
 
 
-def collect_and_process(year, min_violations, fetch_details, label):
+def collect_and_process(year, min_violations, fetch_details, label, use_cache=True,
+                        only_address=False):
     """Scrape all NAICS codes for one year, enrich, deduplicate, sort."""
     print(f"\n{'='*60}")
     print(f"SECTION: {label}")
     print(f"{'='*60}")
 
-    all_inspections = []
-    for naics_code, naics_label in TARGET_NAICS:
-        rows = scrape_naics(naics_code, naics_label, year, min_violations)
-        for r in rows:
-            r["naics_label"] = naics_label
-        all_inspections.extend(rows)
+    # NAICS codes are independent — scrape them in parallel (I/O-bound).
+    # Dedupe by activity number as rows arrive (first NAICS wins) so an
+    # inspection listed under two codes is only detail-fetched once.
+    by_activity = {}
+    with ThreadPoolExecutor(max_workers=len(TARGET_NAICS)) as ex:
+        scraped = ex.map(
+            lambda naics: scrape_naics(naics[0], naics[1], year, min_violations),
+            TARGET_NAICS,
+        )
+        for (naics_code, naics_label), rows in zip(TARGET_NAICS, scraped):
+            for r in rows:
+                if r["activity_nr"] not in by_activity:
+                    r["naics_label"] = naics_label
+                    by_activity[r["activity_nr"]] = r
+    unique = list(by_activity.values())
 
-    print(f"\n  {label} total: {len(all_inspections)} inspections")
+    print(f"\n  {label} total: {len(unique)} inspections")
 
-    if not all_inspections:
+    if not unique:
         return []
 
     if fetch_details:
-        all_inspections = enrich_with_details(all_inspections)
+        unique = enrich_with_details(unique, use_cache, only_address)
 
-    for r in all_inspections:
+    for r in unique:
         r["priority"] = compute_priority(r)
 
-    # Deduplicate
-    seen = set()
-    unique = []
-    for r in all_inspections:
-        key = r["activity_nr"]
-        if key not in seen:
-            seen.add(key)
-            unique.append(r)
-
     # Sort: by date desc for 2026 (newest first), by violations desc for 2025
     if min_violations == 0:
         unique.sort(key=lambda r: r.get("date_opened", ""), reverse=True)
@@ -582,6 +802,8 @@ def main():
                         help="Preview results without writing to sheet")
     parser.add_argument("--no-details", action="store_true",
                         help="Skip detail page fetches (faster, no city/address/penalty)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-download detail pages instead of using the local cache")
     args = parser.parse_args()
 
     fetch_details = FETCH_DETAILS and not args.no_details
@@ -592,6 +814,8 @@ def main():
         min_violations=0,
         fetch_details=fetch_details,  # fetch address; penalty/violations won't exist yet for 2026
         label="2026 Fresh Leads (all inspections, citations pending)",
+        use_cache=not args.no_cache,
+        only_address=True,
     )
 
     # --- Section C: 2025 — only inspections with confirmed violations ---
@@ -600,6 +824,7 @@ def main():
         min_violations=1,
         fetch_details=fetch_details,
         label="2025 Confirmed Violations (citations issued)",
+        use_cache=not args.no_cache,
     )
 
     # Summary
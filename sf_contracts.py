@@ -5,15 +5,21 @@ Filters via SoQL query for efficiency.
 Exports directly to Google Sheets.
 """
 
-import json
 import ssl
 import sys
 import urllib.parse
+from collections import namedtuple
 from datetime import datetime
-from urllib.request import urlopen, Request
+from functools import lru_cache
+from itertools import zip_longest
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+import urllib3
+
+# orjson decodes the Socrata pages faster; both accept raw bytes
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 # --- SSL setup (macOS Python often lacks default certs) ---
 try:
@@ -24,6 +30,16 @@ except ImportError:
     SSL_CTX.check_hostname = False
     SSL_CTX.verify_mode = ssl.CERT_NONE
 
+# One keep-alive pool for every fetch; responses come back gzipped
+HTTP = urllib3.PoolManager(
+    num_pools=4, maxsize=10, ssl_context=SSL_CTX,
+    headers={
+        "User-Agent": "SFContractScraper/1.0",
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip",
+    },
+)
+
 # --- Config ---
 # Socrata API endpoint for SF Supplier Contracts dataset
 SOCRATA_ENDPOINT = "https://data.sfgov.org/resource/cqi5-hm2d.json"
@@ -31,6 +47,7 @@ SOCRATA_ENDPOINT = "https://data.sfgov.org/resource/cqi5-hm2d.json"
 # Filter settings
 MIN_AMOUNT = 1_000_000  # Award amount >= $1M
 FILTER_YEAR = 2026      # Contracts starting in 2026
+PAGE_SIZE = 1000        # Socrata rows per request
 
 # Google Sheets config (same as Austin)
 SERVICE_ACCOUNT_FILE = "service-account-key.json"
@@ -41,6 +58,17 @@ SHEET_NAME = "Webscraper Tool for Procurement Sites Two"
 DATASET_URL = "https://data.sfgov.org/City-Management-and-Ethics/Supplier-Contracts/cqi5-hm2d"
 
 
+# One row per (contract_no, prime_contractor) — Socrata dedups server-side,
+# the other columns are collapsed with max() and aliased back to their names.
+SOCRATA_SELECT = ", ".join(["contract_no", "prime_contractor"] + [
+    f"max({col}) AS {col}"
+    for col in (
+        "contract_title", "term_start_date", "agreed_amt", "pmt_amt",
+        "scope_of_work", "department", "purchasing_authority",
+    )
+])
+
+
 def build_soql_query():
     """Build the SoQL $where clause for filtering."""
     conditions = [
@@ -53,24 +81,33 @@ def build_soql_query():
 
 
 def fetch_from_socrata():
-    """Fetch data from Socrata API with SoQL filters."""
+    """Yield rows from Socrata API with SoQL filters, one page at a time."""
     where_clause = build_soql_query()
     params = {
+        "$select": SOCRATA_SELECT,
         "$where": where_clause,
-        "$limit": 10000,  # Max records
+        "$group": "contract_no, prime_contractor",
+        "$order": "contract_no, prime_contractor",  # stable paging
+        "$limit": PAGE_SIZE,
     }
-    url = f"{SOCRATA_ENDPOINT}?{urllib.parse.urlencode(params)}"
 
     print(f"Socrata API Query:")
     print(f"  $where={where_clause}")
+    print(f"  $group=contract_no, prime_contractor")
     print(f"Fetching from: {SOCRATA_ENDPOINT}")
 
-    req = Request(url, headers={
-        "User-Agent": "SFContractScraper/1.0",
-        "Accept": "application/json",
-    })
-    with urlopen(req, context=SSL_CTX, timeout=120) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+    offset = 0
+    while True:
+        params["$offset"] = offset
+        url = f"{SOCRATA_ENDPOINT}?{urllib.parse.urlencode(params)}"
+        resp = HTTP.request("GET", url, timeout=120)
+        if resp.status != 200:
+            raise urllib3.exceptions.HTTPError(f"Socrata returned HTTP {resp.status}")
+        batch = _json.loads(resp.data)
+        yield from batch
+        if len(batch) < PAGE_SIZE:
+            break
+        offset += PAGE_SIZE
 
 
 def parse_date(date_str):
@@ -83,28 +120,35 @@ def parse_date(date_str):
         return None
 
 
+_AMT_STRIP = str.maketrans("", "", "$,")
+
+
 def parse_amount(amount_str):
     """Parse dollar amount string."""
-    if not amount_str:
-        return 0.0
     try:
-        return float(str(amount_str).replace(",", "").replace("$", ""))
+        return float(str(amount_str).translate(_AMT_STRIP))
     except ValueError:
         return 0.0
 
 
+# Placeholder titles/scopes that carry no description
+_DESC_JUNK = frozenset({"", "x", "prime", "unspecified"})
+
+
 def build_description(row):
     """Build a rich project description from available fields."""
     parts = []
 
     # Contract title is the main description
-    title = row.get("contract_title", "").strip()
-    if title and title.lower() not in ["x", "prime", "unspecified"]:
+    title = (row.get("contract_title") or "").strip()
+    title_lc = title.casefold()
+    if title_lc not in _DESC_JUNK:
         parts.append(title)
 
     # Add scope of work if different and meaningful
-    scope = row.get("scope_of_work", "").strip()
-    if scope and scope.lower() not in ["x", "prime", "unspecified", title.lower()]:
+    scope = (row.get("scope_of_work") or "").strip()
+    scope_lc = scope.casefold()
+    if scope_lc not in _DESC_JUNK and scope_lc != title_lc:
         parts.append(scope)
 
     # Add department context
@@ -129,45 +173,30 @@ def build_award_link(contract_number):
 
 def scrape_all():
     """Main scrape pipeline: fetch from Socrata API -> transform -> return results."""
-    data = fetch_from_socrata()
-
-    print(f"\n--- Socrata API returned {len(data)} records ---")
-
+    # Rows are already unique per (contract_no, prime_contractor) via $group
     results = []
-    seen = set()
 
-    for row in data:
+    for row in fetch_from_socrata():
         contract_num = row.get("contract_no", "")
-        supplier = row.get("prime_contractor", "")
-
-        # Deduplicate by contract number + supplier
-        dedup_key = (contract_num, supplier)
-        if dedup_key in seen:
-            continue
-        seen.add(dedup_key)
 
         start_date = parse_date(row.get("term_start_date", ""))
         award_amount = parse_amount(row.get("agreed_amt", "0"))
         payments_made = parse_amount(row.get("pmt_amt", "0"))
 
-        results.append({
-            "company_name": row.get("prime_contractor", ""),
-            "contract_name": row.get("contract_title", ""),
-            "award_amount": award_amount,
-            "amount_expended": payments_made,
-            "begin_date": start_date.strftime("%Y-%m-%d") if start_date else "",
-            "award_link": build_award_link(contract_num),
-            "description": build_description(row),
-            "commodity_type": "Construction",
-            "contact_name": "",  # Not available
-            "address": "",       # Not available
-            "phone": "",         # Not available
-            "email": "",         # Not available
-            "website": "",       # Not available
-            "city": "San Francisco",
-        })
-
-    print(f"After deduplication: {len(results)} unique contracts")
+        results.append(SheetRow(
+            city="San Francisco",
+            company_name=row.get("prime_contractor", ""),
+            contract_name=row.get("contract_title", ""),
+            award_amount=award_amount,
+            amount_expended=payments_made,
+            begin_date=start_date.strftime("%Y-%m-%d") if start_date else "",
+            award_link=build_award_link(contract_num),
+            description=build_description(row),
+            commodity_type="Construction",
+            # contact_name/address/phone/email/website not available
+        ))
+
+    print(f"\n--- Socrata API returned {len(results)} unique contracts ---")
     return results
 
 
@@ -185,9 +214,18 @@ SHEET_HEADERS = [
     "Award Link", "Project Description", "Commodity Type",
 ]
 
+# Results are positional rows in SHEET_FIELDS order, so they go to the
+# Sheets API as-is; blank columns default to "".
+SheetRow = namedtuple("SheetRow", SHEET_FIELDS, defaults=("",) * len(SHEET_FIELDS))
+
 
+@lru_cache(maxsize=None)
 def get_sheets_service():
-    """Authenticate and return Google Sheets API service."""
+    """Authenticate and return Google Sheets API service (built once per process)."""
+    # Imported here so --preview runs never load the Google client
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+
     creds = service_account.Credentials.from_service_account_file(
         SERVICE_ACCOUNT_FILE,
         scopes=["https://www.googleapis.com/auth/spreadsheets"]
@@ -195,17 +233,61 @@ def get_sheets_service():
     return build("sheets", "v4", credentials=creds)
 
 
-def get_existing_data(service):
-    """Fetch existing data from the sheet to append to."""
+@lru_cache(maxsize=None)
+def _norm(value):
+    """Canonical form of a company/contract name for dedup."""
+    return value.strip().casefold()
+
+
+def get_existing_fingerprints(service):
+    """Fetch (company_name, contract_name) pairs already in the sheet.
+
+    Only columns B and H are read. Returns None if the sheet is empty; API
+    errors propagate rather than passing for an empty sheet.
+    """
     sheet = service.spreadsheets()
-    try:
-        result = sheet.values().get(
+    result = sheet.values().batchGet(
+        spreadsheetId=SPREADSHEET_ID,
+        ranges=[f"'{SHEET_NAME}'!B:B", f"'{SHEET_NAME}'!H:H"],
+        majorDimension="COLUMNS",
+    ).execute()
+    columns = [
+        (vr.get("values") or [[]])[0] for vr in result.get("valueRanges", [])
+    ]
+    if not any(columns):
+        return None
+    companies, contracts = columns
+    # Skip the header row
+    return {
+        (_norm(company), _norm(contract))
+        for company, contract in zip_longest(companies[1:], contracts[1:], fillvalue="")
+    }
+
+
+# Sheet title -> sheetId, so repeat writes skip the metadata RPC
+_SHEET_ID_CACHE = {}
+
+
+def ensure_sheet(sheet):
+    """Return the target sheet's ID, creating the sheet if it doesn't exist."""
+    if SHEET_NAME in _SHEET_ID_CACHE:
+        return _SHEET_ID_CACHE[SHEET_NAME]
+
+    spreadsheet = sheet.get(
+        spreadsheetId=SPREADSHEET_ID, fields="sheets.properties(sheetId,title)"
+    ).execute()
+    for s in spreadsheet.get("sheets", []):
+        _SHEET_ID_CACHE[s["properties"]["title"]] = s["properties"]["sheetId"]
+
+    if SHEET_NAME not in _SHEET_ID_CACHE:
+        reply = sheet.batchUpdate(
             spreadsheetId=SPREADSHEET_ID,
-            range=f"'{SHEET_NAME}'!A:N"
+            body={"requests": [{"addSheet": {"properties": {"title": SHEET_NAME}}}]},
         ).execute()
-        return result.get("values", [])
-    except Exception:
-        return []
+        _SHEET_ID_CACHE[SHEET_NAME] = reply["replies"][0]["addSheet"]["properties"]["sheetId"]
+        print(f"Created new sheet: {SHEET_NAME}")
+
+    return _SHEET_ID_CACHE[SHEET_NAME]
 
 
 def write_to_google_sheets(results):
@@ -213,68 +295,36 @@ def write_to_google_sheets(results):
     service = get_sheets_service()
     sheet = service.spreadsheets()
 
-    # Get the sheet ID for our target sheet
-    spreadsheet = sheet.get(spreadsheetId=SPREADSHEET_ID).execute()
-    sheet_id = None
-    for s in spreadsheet.get("sheets", []):
-        if s["properties"]["title"] == SHEET_NAME:
-            sheet_id = s["properties"]["sheetId"]
-            break
-
-    if sheet_id is None:
-        # Create the sheet if it doesn't exist
-        request = {
-            "requests": [{
-                "addSheet": {
-                    "properties": {"title": SHEET_NAME}
-                }
-            }]
-        }
-        sheet.batchUpdate(spreadsheetId=SPREADSHEET_ID, body=request).execute()
-        print(f"Created new sheet: {SHEET_NAME}")
+    ensure_sheet(sheet)
 
     # APPEND ONLY — never clear the sheet.
     # Deduplicates by (company_name, contract_name) to avoid double-writing.
-    existing = get_existing_data(service)
-    start_row = len(existing) + 1
+    existing_fps = get_existing_fingerprints(service)
+    sheet_empty = existing_fps is None
+    if sheet_empty:
+        existing_fps = set()
 
-    existing_fps = {
-        (row[1].strip().lower(), row[7].strip().lower())
-        for row in (existing[1:] if len(existing) > 1 else [])
-        if len(row) > 7
-    }
     new_results = [
         r for r in results
-        if (r.get("company_name", "").strip().lower(),
-            r.get("contract_name", "").strip().lower()) not in existing_fps
+        if (_norm(r.company_name),
+            _norm(r.contract_name)) not in existing_fps
     ]
     if len(new_results) < len(results):
         print(f"  Skipped {len(results) - len(new_results)} already-existing entries")
     results = new_results
 
-    # If sheet is empty, add headers first
-    if not existing:
-        header_range = f"'{SHEET_NAME}'!A1"
-        sheet.values().update(
-            spreadsheetId=SPREADSHEET_ID,
-            range=header_range,
-            valueInputOption="RAW",
-            body={"values": [SHEET_HEADERS]}
-        ).execute()
-        start_row = 2
-
-    # Build data rows
-    rows = []
-    for r in results:
-        rows.append([r.get(f, "") for f in SHEET_FIELDS])
+    # SheetRows are already positional; if sheet is empty, the header row
+    # goes out in the same append
+    rows = [SHEET_HEADERS, *results] if sheet_empty else results
 
     if rows:
-        write_range = f"'{SHEET_NAME}'!A{start_row}"
-        sheet.values().update(
+        # Server appends after the last row of the table — no offset to compute
+        sheet.values().append(
             spreadsheetId=SPREADSHEET_ID,
-            range=write_range,
+            range=f"'{SHEET_NAME}'!A1",
             valueInputOption="RAW",
-            body={"values": rows}
+            insertDataOption="INSERT_ROWS",
+            body={"values": rows},
         ).execute()
 
     print(f"Wrote {len(results)} rows to Google Sheet: {SHEET_NAME}")
@@ -284,11 +334,11 @@ def preview_results(results, limit=10):
     """Print a preview of the results."""
     print(f"\n--- Preview (first {min(limit, len(results))} results) ---\n")
     for i, r in enumerate(results[:limit], 1):
-        print(f"{i}. {r['company_name']}")
-        print(f"   Contract: {r['contract_name']}")
-        print(f"   Award: ${r['award_amount']:,.2f} | Paid: ${r['amount_expended']:,.2f}")
-        print(f"   Date: {r['begin_date']}")
-        print(f"   Description: {r['description'][:100]}...")
+        print(f"{i}. {r.company_name}")
+        print(f"   Contract: {r.contract_name}")
+        print(f"   Award: ${r.award_amount:,.2f} | Paid: ${r.amount_expended:,.2f}")
+        print(f"   Date: {r.begin_date}")
+        print(f"   Description: {r.description[:100]}...")
         print()
 
 
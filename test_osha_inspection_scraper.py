@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+import osha_inspection_scraper as osha
+
+
+class FakeContent:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def iter_chunked(self, size):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class FakeResponse:
+    def __init__(self, body, charset=None, status=200):
+        self.status = status
+        self.charset = charset
+        self.content = FakeContent([body[i:i + 4] for i in range(0, len(body), 4)])
+
+    def raise_for_status(self):
+        pass
+
+    def get_encoding(self):
+        if self.charset is None:
+            raise RuntimeError("no charset")
+        return self.charset
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, resp):
+        self.resp = resp
+
+    def get(self, url, timeout=None):
+        return self.resp
+
+
+def download(resp):
+    return asyncio.run(
+        osha.download_detail_page(FakeSession(resp), asyncio.Semaphore(1), "https://example.test/")
+    )
+
+
+def test_download_detail_page_without_charset_defaults_to_utf8():
+    body = "<p>Café Street</p>".encode("utf-8")
+    assert download(FakeResponse(body)) == "<p>Café Street</p>"
+
+
+def test_download_detail_page_uses_declared_charset():
+    body = "<p>Café Street</p>".encode("latin-1")
+    assert download(FakeResponse(body, charset="latin-1")) == "<p>Café Street</p>"
+
+
+def test_clean_html_text_drops_tags_and_collapses_whitespace():
+    assert osha.clean_html_text("Foo <b>Bar</b>") == "Foo Bar"
+    assert osha.clean_html_text("Initial<br>\n Penalty") == "Initial Penalty"
+    assert osha.clean_html_text("$1,<b>000</b>") == "$1,000"
+    assert osha.clean_html_text(" A &amp; <i>B</i> ") == "A & B"
+
+
+def test_parse_inspection_detail_th_with_inner_markup():
+    html = (
+        "<table>"
+        "<tr><th>Initial <span>Penalty</span>:</th><td>$12,<b>500</b></td></tr>"
+        "<tr><th>Current\n  Penalty</th><td> $8,000 </td></tr>"
+        "</table>"
+    )
+    detail = osha.parse_inspection_detail(html)
+    assert detail["initial_penalty"] == 12500.0
+    assert detail["current_penalty"] == 8000.0
+
+
+def test_parse_inspection_detail_site_address():
+    html = (
+        "<p><strong>Site Address</strong>: <br> Acme <b>Co</b><br> 12  Main St<br>"
+        "Austin, TX 78701</p>"
+    )
+    detail = osha.parse_inspection_detail(html, only_address=True)
+    assert detail == {"city": "Austin", "address": "12 Main St"}
+
+
+def test_fetch_details_survives_per_item_errors(monkeypatch):
+    async def fake_fetch(session, sem, insp, use_cache, only_address):
+        if insp["activity_nr"] == "2":
+            raise RuntimeError("boom")
+        return {"city": "Austin"}
+
+    monkeypatch.setattr(osha, "fetch_inspection_detail", fake_fetch)
+    monkeypatch.setattr(osha, "OSHA_CONCURRENCY", 1)
+    inspections = [
+        {"activity_nr": str(i), "detail_link": f"https://example.test/{i}", "estab_name": "Acme"}
+        for i in range(1, 4)
+    ]
+    asyncio.run(asyncio.wait_for(osha.fetch_details(inspections), timeout=5))
+    assert [insp.get("city") for insp in inspections] == ["Austin", None, "Austin"]
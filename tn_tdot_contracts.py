@@ -7,18 +7,16 @@ Two PDF formats supported:
 Exports directly to Google Sheets in append mode.
 """
 
+import json
 import re
 import ssl
 import sys
-import tempfile
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from urllib.error import HTTPError
-from urllib.request import urlopen, Request
+from functools import lru_cache
 
-import fitz  # PyMuPDF
-
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+import urllib3
 
 # --- SSL setup (macOS Python often lacks default certs) ---
 try:
@@ -29,6 +27,14 @@ except ImportError:
     SSL_CTX.check_hostname = False
     SSL_CTX.verify_mode = ssl.CERT_NONE
 
+# One keep-alive pool for every fetch; responses come back gzipped and
+# transient gateway errors are retried
+HTTP = urllib3.PoolManager(
+    num_pools=4, maxsize=10, ssl_context=SSL_CTX,
+    retries=urllib3.Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    headers={"User-Agent": "TN-TDOT-Scraper/1.0", "Accept-Encoding": "gzip"},
+)
+
 # --- Config ---
 BASE_URL = "https://www.tn.gov/content/dam/tn/tdot/construction/2026_bid_lettings"
 
@@ -38,6 +44,10 @@ LETTINGS_2026 = [
     ("february-6,-2026-letting", "20260206", "February 06, 2026"),
 ]
 
+# Letting PDFs downloaded in parallel; per-request timeout in seconds
+DOWNLOAD_WORKERS = 8
+DOWNLOAD_TIMEOUT = 30
+
 # Google Sheets config (same as other scrapers)
 SERVICE_ACCOUNT_FILE = "service-account-key.json"
 SPREADSHEET_ID = "1HQMnHzPrx0Qa4ijuaR0BcVptpiiVG7mE3Po17rvruKQ"
@@ -68,71 +78,108 @@ NAICS_FILTERS = [
     ]),
 ]
 
-KEEP_UPPER = {"LLC", "LP", "LLP", "PLLC", "LTD", "JV", "II", "III", "IV", "PC", "PA", "INC", "CO", "DBA"}
+KEEP_UPPER = frozenset({"LLC", "LP", "LLP", "PLLC", "LTD", "JV", "II", "III", "IV", "PC", "PA", "INC", "CO", "DBA"})
+
+
+# A whole whitespace-delimited token from KEEP_UPPER, optionally followed by ".,"
+KEEP_RE = re.compile(
+    r"(?<!\S)(" + "|".join(sorted(KEEP_UPPER, key=len, reverse=True)) + r")(?=[.,]*(?!\S))",
+    re.IGNORECASE,
+)
 
 
+@lru_cache(maxsize=4096)
 def title_case(name):
     """Convert 'JONES BROS. CONTRACTORS, LLC' to 'Jones Bros. Contractors, LLC'."""
     if not name:
         return ""
-    words = name.title().split()
-    return " ".join(w.upper() if w.upper().rstrip(".,") in KEEP_UPPER else w for w in words)
+    titled = SPACE_RE.sub(" ", name.title()).strip()
+    return KEEP_RE.sub(lambda m: m.group(1).upper(), titled)
+
+
+# Every NAICS keyword in one alternation, mapped back to its category's
+# position in NAICS_FILTERS. The lookahead reports overlapping hits, so a
+# single scan sees every keyword the old nested loop would have.
+_NAICS_KEYWORD_INDEX = {}
+for _i, (_code, _label, _keywords) in enumerate(NAICS_FILTERS):
+    for _kw in _keywords:
+        _NAICS_KEYWORD_INDEX.setdefault(_kw, _i)
+NAICS_RE = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in sorted(_NAICS_KEYWORD_INDEX, key=len, reverse=True)) + "))"
+)
 
 
 def match_naics(text):
     """Match description text to a NAICS category."""
-    lower = text.lower()
-    for code, label, keywords in NAICS_FILTERS:
-        for kw in keywords:
-            if kw in lower:
-                return code, label
-    return "237310", "Highway/Street/Bridge"  # Default for TDOT contracts
+    best = None
+    for m in NAICS_RE.finditer(text.lower()):
+        idx = _NAICS_KEYWORD_INDEX[m.group(1)]
+        if best is None or idx < best:
+            best = idx
+            if best == 0:
+                break
+    if best is None:
+        return "237310", "Highway/Street/Bridge"  # Default for TDOT contracts
+    code, label, _ = NAICS_FILTERS[best]
+    return code, label
 
 
 # --- PDF Download & Parse ---
 
 def download_url(url):
-    """Download a URL to a temp file. Returns path or None on 404."""
-    req = Request(url, headers={"User-Agent": "TN-TDOT-Scraper/1.0"})
-    try:
-        with urlopen(req, context=SSL_CTX, timeout=120) as resp:
-            data = resp.read()
-    except HTTPError as e:
-        if e.code == 404:
-            return None
-        raise
-    tmp = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
-    tmp.write(data)
-    tmp.close()
-    return tmp.name
-
-
-def extract_pdf_text(pdf_path):
-    """Extract full text from a PDF file."""
-    doc = fitz.open(pdf_path)
-    text = ""
-    for page in doc:
-        text += page.get_text() + "\n"
-    doc.close()
-    return text
+    """Download a URL into memory. Returns the bytes or None on 404."""
+    resp = HTTP.request("GET", url, timeout=DOWNLOAD_TIMEOUT)
+    if resp.status == 404:
+        return None
+    if resp.status != 200:
+        raise urllib3.exceptions.HTTPError(f"HTTP {resp.status} for {url}")
+    return resp.data
+
+
+def extract_pdf_text(pdf_bytes):
+    """Extract full text from an in-memory PDF."""
+    import fitz  # PyMuPDF, loaded only when a PDF is actually downloaded
+
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        pages = [page.get_text() for page in doc]
+    # Trailing newline keeps the last block's "\n" anchors intact
+    return "\n".join(pages) + "\n"
+
+
+# Contract Awards block: bid, estimate, call, contractor, project code
+BLOCK_RE = re.compile(
+    r'(\$[\d,]+\.\d{2})\s*\n'
+    r'(\$[\d,]+\.\d{2})\s*\n'
+    r'Estimate\s*\n'
+    r'(\d{3})\s*\n'
+    r'([A-Z][A-Z &,.\-/\'0-9]+?)\s*\n'
+    r'Project\s*\n'
+    r'(\w+)\s*\n',
+    re.MULTILINE,
+)
+DESC_RE = re.compile(r'(?:Contractor\s*\n)?(THE [A-Z].*?)(?=\nCounty\b)', re.DOTALL)
+COUNTY_RE = re.compile(r'County\s*\n\s*Total Bid\s*\n([^\n]+)')
+ETC_RE = re.compile(r'\s*,\s*ETC\.?', re.IGNORECASE)
+WS_RE = re.compile(r'\s{2,}')
+SPACE_RE = re.compile(r'\s+')
+
+
+def clean_county(county):
+    """Normalize a county cell: 'KNOX, ETC.' -> 'KNOX et al.'."""
+    county = ETC_RE.sub(' et al.', county.strip())
+    return WS_RE.sub(' ', county).strip(' ,&')
 
 
 def parse_contract_awards(text, letting_date, pdf_url):
     """Parse a Contract Awards PDF (finalized awards with estimate + bid amounts)."""
     contracts = []
 
-    block_pattern = re.compile(
-        r'(\$[\d,]+\.\d{2})\s*\n'
-        r'(\$[\d,]+\.\d{2})\s*\n'
-        r'Estimate\s*\n'
-        r'(\d{3})\s*\n'
-        r'([A-Z][A-Z &,.\-/\'0-9]+?)\s*\n'
-        r'Project\s*\n'
-        r'(\w+)\s*\n',
-        re.MULTILINE,
-    )
+    # Description/county are searched only up to the next block, not to
+    # the end of the document
+    matches = list(BLOCK_RE.finditer(text))
+    ends = [m.start() for m in matches[1:]] + [len(text)]
 
-    for m in block_pattern.finditer(text):
+    for m, end in zip(matches, ends):
         amount1_str = m.group(1).replace("$", "").replace(",", "")
         amount2_str = m.group(2).replace("$", "").replace(",", "")
         call_num = m.group(3)
@@ -146,18 +193,16 @@ def parse_contract_awards(text, letting_date, pdf_url):
             amt1, amt2 = 0, 0
         total_bid = max(amt1, amt2)
 
-        after_match = text[m.end():]
+        chunk = text[m.end():end]
         desc = ""
-        desc_match = re.search(r'(?:Contractor\s*\n)?(THE [A-Z].*?)(?=\nCounty\b)', after_match, re.DOTALL)
+        desc_match = DESC_RE.search(chunk)
         if desc_match:
-            desc = re.sub(r'\s+', ' ', desc_match.group(1).strip())
+            desc = SPACE_RE.sub(' ', desc_match.group(1).strip())
 
         county = ""
-        county_match = re.search(r'County\s*\n\s*Total Bid\s*\n([^\n]+)', after_match)
+        county_match = COUNTY_RE.search(chunk)
         if county_match:
-            county = county_match.group(1).strip()
-            county = re.sub(r'\s*,\s*ETC\.?', ' et al.', county, flags=re.IGNORECASE)
-            county = re.sub(r'\s{2,}', ' ', county).strip(' ,&')
+            county = clean_county(county_match.group(1))
 
         contracts.append({
             "letting_date": letting_date,
@@ -173,34 +218,62 @@ def parse_contract_awards(text, letting_date, pdf_url):
     return contracts
 
 
+# Apparent Bid Results layout
+CONTRACT_RE = re.compile(r'Contract\n(\w+)\n')
+BID_COUNTY_RE = re.compile(r'Project\n([^\n]+)\n\s*County\n')
+BID_DESC_RE = re.compile(r'County\n(THE [A-Z].*?)(?=\n[A-Z0-9])', re.DOTALL)
+AMOUNT_RE = re.compile(r'\$([\d,]+(?:\.\d{2})?)')
+PAGE_RE = re.compile(r'Page\b|\d+ of\b', re.IGNORECASE)
+
+
+_CALL_MARKER = "\nCall\n"
+
+
+def iter_call_blocks(text):
+    """Yield (call_num, content) for each Call block in an Apparent Bid Results PDF.
+
+    A block header is a "Call" line followed by a 3-digit call number line.
+    Scans with str.find instead of re.split.
+    """
+    call_num = None
+    start = 0
+    pos = text.find(_CALL_MARKER)
+    while pos >= 0:
+        num_start = pos + len(_CALL_MARKER)
+        num_end = num_start + 3
+        if text[num_start:num_end].isdecimal() and text[num_end:num_end + 1] == "\n":
+            if call_num is not None:
+                yield call_num, text[start:pos]
+            call_num = text[num_start:num_end]
+            start = num_end + 1
+            pos = text.find(_CALL_MARKER, start)
+        else:
+            pos = text.find(_CALL_MARKER, pos + 1)
+    if call_num is not None:
+        yield call_num, text[start:]
+
+
 def parse_apparent_bid_results(text, letting_date, pdf_url):
     """Parse an Apparent Bid Results PDF (first bidder per call = low bidder / winner)."""
     contracts = []
 
     # Split by "Call\nNNN\n" blocks
-    blocks = re.split(r'\nCall\n(\d{3})\n', text)
-
-    for i in range(1, len(blocks), 2):
-        call_num = blocks[i]
-        content = blocks[i + 1] if i + 1 < len(blocks) else ""
-
+    for call_num, content in iter_call_blocks(text):
         # Contract/Project code
-        contract_match = re.search(r'Contract\n(\w+)\n', content)
+        contract_match = CONTRACT_RE.search(content)
         project_code = contract_match.group(1) if contract_match else ""
 
         # County (appears after "Project\n")
-        county_match = re.search(r'Project\n([^\n]+)\n\s*County\n', content)
+        county_match = BID_COUNTY_RE.search(content)
         county = ""
         if county_match:
-            county = county_match.group(1).strip()
-            county = re.sub(r'\s*,\s*ETC\.?', ' et al.', county, flags=re.IGNORECASE)
-            county = re.sub(r'\s{2,}', ' ', county).strip(' ,&')
+            county = clean_county(county_match.group(1))
 
         # Description (starts with "THE ")
         desc = ""
-        desc_match = re.search(r'County\n(THE [A-Z].*?)(?=\n[A-Z0-9])', content, re.DOTALL)
+        desc_match = BID_DESC_RE.search(content)
         if desc_match:
-            desc = re.sub(r'\s+', ' ', desc_match.group(1).strip())
+            desc = SPACE_RE.sub(' ', desc_match.group(1).strip())
 
         # Bidders listed after "Total Bid\n" — first one is the low bidder (winner)
         bidder_section = content.split("Total Bid\n")[-1] if "Total Bid\n" in content else ""
@@ -210,11 +283,11 @@ def parse_apparent_bid_results(text, letting_date, pdf_url):
         contractor = ""
         total_bid = 0.0
         for j, line in enumerate(lines):
-            amount_match = re.match(r'\$([\d,]+(?:\.\d{2})?)', line)
+            amount_match = AMOUNT_RE.match(line)
             if amount_match and contractor:
                 total_bid = float(amount_match.group(1).replace(",", ""))
                 break
-            elif not amount_match and not re.match(r'Page\b|\d+ of\b', line, re.IGNORECASE):
+            elif not amount_match and not PAGE_RE.match(line):
                 contractor = line
 
         if not contractor:
@@ -236,6 +309,15 @@ def parse_apparent_bid_results(text, letting_date, pdf_url):
 
 # --- Transform to sheet format ---
 
+@lru_cache(maxsize=None)
+def letting_date_iso(letting_date):
+    """'January 09, 2026' -> '2026-01-09'; only a handful of distinct dates per run."""
+    try:
+        return datetime.strptime(letting_date, "%B %d, %Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return letting_date
+
+
 def transform_results(raw_contracts):
     """Transform parsed PDF data into the 14-column sheet format."""
     results = []
@@ -247,11 +329,7 @@ def transform_results(raw_contracts):
             continue
         seen.add(dedup_key)
 
-        try:
-            date_obj = datetime.strptime(c["letting_date"], "%B %d, %Y")
-            date_str = date_obj.strftime("%Y-%m-%d")
-        except ValueError:
-            date_str = c["letting_date"]
+        date_str = letting_date_iso(c["letting_date"])
 
         naics_code, naics_label = match_naics(c["description"])
         commodity_type = f"{naics_label} (NAICS {naics_code})"
@@ -265,55 +343,63 @@ def transform_results(raw_contracts):
 
         county = title_case(c["county"]) if c["county"] else ""
 
-        results.append({
-            "city": f"Tennessee ({county})" if county else "Tennessee",
-            "company_name": title_case(c["contractor"]),
-            "contact_name": "",
-            "phone": "",
-            "email": "",
-            "address": "",
-            "website": "",
-            "contract_name": f"TDOT {c['project_code']} (Call {c['call']})",
-            "award_amount": c["total_bid"],
-            "amount_expended": "",
-            "begin_date": date_str,
-            "award_link": c["pdf_url"],
-            "description": desc,
-            "commodity_type": commodity_type,
-        })
+        results.append(SheetRow(
+            city=f"Tennessee ({county})" if county else "Tennessee",
+            company_name=title_case(c["contractor"]),
+            contract_name=f"TDOT {c['project_code']} (Call {c['call']})",
+            award_amount=c["total_bid"],
+            begin_date=date_str,
+            award_link=c["pdf_url"],
+            description=desc,
+            commodity_type=commodity_type,
+        ))
 
     return results
 
 
-def scrape_2026_lettings():
-    """Download and parse all available 2026 letting PDFs."""
-    all_contracts = []
+def fetch_letting_pdf(folder, prefix):
+    """Fetch a letting's PDF: Contract Awards if published, else Apparent Bid Results.
 
-    for folder, prefix, letting_date in LETTINGS_2026:
-        print(f"\n--- {letting_date} ---")
+    Returns (kind, url, pdf_bytes); kind is None if neither PDF is up yet.
+    """
+    awards_url = f"{BASE_URL}/{folder}/{prefix}_ContractAwards.pdf"
+    pdf_bytes = download_url(awards_url)
+    if pdf_bytes:
+        return "awards", awards_url, pdf_bytes
 
-        # Try Contract Awards first (finalized), fall back to Apparent Bid Results
-        awards_url = f"{BASE_URL}/{folder}/{prefix}_ContractAwards.pdf"
-        bid_results_url = f"{BASE_URL}/{folder}/{prefix}_ApparentBidResults.pdf"
+    bid_results_url = f"{BASE_URL}/{folder}/{prefix}_ApparentBidResults.pdf"
+    pdf_bytes = download_url(bid_results_url)
+    if pdf_bytes:
+        return "bid_results", bid_results_url, pdf_bytes
+    return None, awards_url, None
 
-        print(f"  Trying Contract Awards: {awards_url}")
-        pdf_path = download_url(awards_url)
-        if pdf_path:
-            text = extract_pdf_text(pdf_path)
-            contracts = parse_contract_awards(text, letting_date, awards_url)
-            print(f"  Parsed {len(contracts)} awards (finalized)")
-            all_contracts.extend(contracts)
-            continue
 
-        print(f"  No Contract Awards PDF. Trying Apparent Bid Results...")
-        pdf_path = download_url(bid_results_url)
-        if pdf_path:
-            text = extract_pdf_text(pdf_path)
-            contracts = parse_apparent_bid_results(text, letting_date, bid_results_url)
-            print(f"  Parsed {len(contracts)} apparent low bids")
-            all_contracts.extend(contracts)
-        else:
-            print(f"  No PDFs available yet for this letting.")
+def scrape_2026_lettings():
+    """Download and parse all available 2026 letting PDFs."""
+    all_contracts = []
+
+    # Downloads run concurrently; parsing stays in letting order
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+        fetched = pool.map(lambda l: fetch_letting_pdf(l[0], l[1]), LETTINGS_2026)
+
+        for (folder, prefix, letting_date), (kind, url, pdf_bytes) in zip(LETTINGS_2026, fetched):
+            print(f"\n--- {letting_date} ---")
+
+            # Try Contract Awards first (finalized), fall back to Apparent Bid Results
+            if kind == "awards":
+                print(f"  Contract Awards: {url}")
+                text = extract_pdf_text(pdf_bytes)
+                contracts = parse_contract_awards(text, letting_date, url)
+                print(f"  Parsed {len(contracts)} awards (finalized)")
+                all_contracts.extend(contracts)
+            elif kind == "bid_results":
+                print(f"  No Contract Awards PDF. Using Apparent Bid Results: {url}")
+                text = extract_pdf_text(pdf_bytes)
+                contracts = parse_apparent_bid_results(text, letting_date, url)
+                print(f"  Parsed {len(contracts)} apparent low bids")
+                all_contracts.extend(contracts)
+            else:
+                print(f"  No PDFs available yet for this letting.")
 
     return all_contracts
 
@@ -333,8 +419,18 @@ SHEET_HEADERS = [
     "Award Link", "Project Description", "Commodity Type",
 ]
 
+# Results are positional rows in SHEET_FIELDS order, so they go to the
+# Sheets API as-is; blank columns default to "".
+SheetRow = namedtuple("SheetRow", SHEET_FIELDS, defaults=("",) * len(SHEET_FIELDS))
+
 
+@lru_cache(maxsize=None)
 def get_sheets_service():
+    """Built once per process; reuses the credentials and discovery doc."""
+    # Imported here so --preview runs never load the Google client
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+
     creds = service_account.Credentials.from_service_account_file(
         SERVICE_ACCOUNT_FILE,
         scopes=["https://www.googleapis.com/auth/spreadsheets"],
@@ -343,72 +439,146 @@ def get_sheets_service():
 
 
 def get_existing_data(service):
-    sheet = service.spreadsheets()
+    # No try/except: an empty list here means "empty sheet" to the caller
+    result = service.spreadsheets().values().get(
+        spreadsheetId=SPREADSHEET_ID,
+        range=f"'{SHEET_NAME}'!A:N",
+    ).execute()
+    return result.get("values", [])
+
+
+# Local copy of the sheet's dedup fingerprints. Re-runs only read the rows
+# added since the last sync instead of the whole A:N range.
+SHEET_CACHE_FILE = ".sheet_cache.json"
+_SHEET_CACHE_KEY = f"{SPREADSHEET_ID}:{SHEET_NAME}"
+_UPDATED_ROW_RE = re.compile(r"(\d+)$")
+
+
+def _row_fp(row):
+    """(company_name, contract_name) fingerprint of a sheet row, or None if too short."""
+    if len(row) > 7:
+        return (str(row[1]).strip().lower(), str(row[7]).strip().lower())
+    return None
+
+
+def _load_sheet_cache():
     try:
-        result = sheet.values().get(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f"'{SHEET_NAME}'!A:N",
-        ).execute()
-        return result.get("values", [])
-    except Exception:
-        return []
+        with open(SHEET_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_sheet_cache(fps, row_count, last_row):
+    cache = _load_sheet_cache()
+    cache[_SHEET_CACHE_KEY] = {
+        "row_count": row_count,
+        "last": _row_fp(last_row),
+        "fps": sorted(fps),
+    }
+    try:
+        with open(SHEET_CACHE_FILE, "w") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"  Warning: could not save {SHEET_CACHE_FILE}: {e}")
+
+
+def get_existing_fingerprints(service):
+    """Return (fingerprints, row_count, last_row) for the sheet.
+
+    Uses the local cache plus a read of rows added since the last sync; falls
+    back to a full read if the cache is missing or the sheet changed above
+    the last synced row.
+    """
+    cached = _load_sheet_cache().get(_SHEET_CACHE_KEY)
+    if cached and cached["row_count"] > 0:
+        row_count = cached["row_count"]
+        try:
+            result = service.spreadsheets().values().get(
+                spreadsheetId=SPREADSHEET_ID,
+                range=f"'{SHEET_NAME}'!A{row_count}:N",
+            ).execute()
+            tail = result.get("values", [])
+        except Exception:
+            tail = []
+        last = tuple(cached["last"]) if cached["last"] else None
+        if tail and _row_fp(tail[0]) == last:
+            fps = {tuple(fp) for fp in cached["fps"]}
+            fps.update(fp for fp in map(_row_fp, tail[1:]) if fp)
+            return fps, row_count + len(tail) - 1, tail[-1]
 
+    existing = get_existing_data(service)
+    fps = {fp for fp in map(_row_fp, existing[1:]) if fp}
+    return fps, len(existing), existing[-1] if existing else []
 
-def write_to_google_sheets(results):
-    """Append results to Google Sheets. Never clears existing data."""
-    service = get_sheets_service()
-    sheet = service.spreadsheets()
 
-    spreadsheet = sheet.get(spreadsheetId=SPREADSHEET_ID).execute()
-    sheet_id = None
+# Sheet title -> sheetId, so repeat writes skip the metadata RPC
+_SHEET_ID_CACHE = {}
+
+
+def ensure_sheet(sheet):
+    """Return the target sheet's ID, creating the sheet if it doesn't exist."""
+    if SHEET_NAME in _SHEET_ID_CACHE:
+        return _SHEET_ID_CACHE[SHEET_NAME]
+
+    spreadsheet = sheet.get(
+        spreadsheetId=SPREADSHEET_ID, fields="sheets.properties(sheetId,title)"
+    ).execute()
     for s in spreadsheet.get("sheets", []):
-        if s["properties"]["title"] == SHEET_NAME:
-            sheet_id = s["properties"]["sheetId"]
-            break
+        _SHEET_ID_CACHE[s["properties"]["title"]] = s["properties"]["sheetId"]
 
-    if sheet_id is None:
-        sheet.batchUpdate(
+    if SHEET_NAME not in _SHEET_ID_CACHE:
+        reply = sheet.batchUpdate(
             spreadsheetId=SPREADSHEET_ID,
             body={"requests": [{"addSheet": {"properties": {"title": SHEET_NAME}}}]},
         ).execute()
+        _SHEET_ID_CACHE[SHEET_NAME] = reply["replies"][0]["addSheet"]["properties"]["sheetId"]
         print(f"Created new sheet: {SHEET_NAME}")
 
+    return _SHEET_ID_CACHE[SHEET_NAME]
+
+
+def write_to_google_sheets(results):
+    """Append results to Google Sheets. Never clears existing data."""
+    service = get_sheets_service()
+    sheet = service.spreadsheets()
+
+    ensure_sheet(sheet)
+
     # APPEND ONLY — never clear the sheet.
     # Deduplicates by (company_name, contract_name) to avoid double-writing.
-    existing = get_existing_data(service)
-    start_row = len(existing) + 1
+    existing_fps, row_count, last_row = get_existing_fingerprints(service)
 
-    existing_fps = {
-        (row[1].strip().lower(), row[7].strip().lower())
-        for row in (existing[1:] if len(existing) > 1 else [])
-        if len(row) > 7
-    }
     new_results = [
         r for r in results
-        if (r.get("company_name", "").strip().lower(),
-            r.get("contract_name", "").strip().lower()) not in existing_fps
+        if (r.company_name.strip().lower(),
+            r.contract_name.strip().lower()) not in existing_fps
     ]
     if len(new_results) < len(results):
         print(f"  Skipped {len(results) - len(new_results)} already-existing entries")
     results = new_results
 
-    if not existing:
-        sheet.values().update(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f"'{SHEET_NAME}'!A1",
-            valueInputOption="RAW",
-            body={"values": [SHEET_HEADERS]},
-        ).execute()
-        start_row = 2
+    # SheetRows are already positional; if sheet is empty, the header row
+    # goes out in the same append
+    rows = [SHEET_HEADERS, *results] if row_count == 0 else results
 
-    rows = [[r.get(f, "") for f in SHEET_FIELDS] for r in results]
     if rows:
-        sheet.values().update(
+        # Server appends after the last row of the table — no offset to compute
+        reply = sheet.values().append(
             spreadsheetId=SPREADSHEET_ID,
-            range=f"'{SHEET_NAME}'!A{start_row}",
+            range=f"'{SHEET_NAME}'!A1",
             valueInputOption="RAW",
+            insertDataOption="INSERT_ROWS",
             body={"values": rows},
         ).execute()
+        updated = reply.get("updates", {}).get("updatedRange", "")
+        m = _UPDATED_ROW_RE.search(updated)
+        row_count = int(m.group(1)) if m else row_count + len(rows)
+        last_row = rows[-1]
+        existing_fps.update(fp for fp in map(_row_fp, results) if fp)
+
+    if row_count:
+        _save_sheet_cache(existing_fps, row_count, last_row)
 
     print(f"Wrote {len(results)} rows to Google Sheet: {SHEET_NAME}")
 
@@ -416,10 +586,10 @@ def write_to_google_sheets(results):
 def preview_results(results, limit=10):
     print(f"\n--- Preview (first {min(limit, len(results))} results) ---\n")
     for i, r in enumerate(results[:limit], 1):
-        print(f"{i}. {r['company_name']}")
-        print(f"   {r['contract_name']} | ${r['award_amount']:,.2f}")
-        print(f"   {r['city']} | {r['begin_date']}")
-        print(f"   {r['description'][:100]}")
+        print(f"{i}. {r.company_name}")
+        print(f"   {r.contract_name} | ${r.award_amount:,.2f}")
+        print(f"   {r.city} | {r.begin_date}")
+        print(f"   {r.description[:100]}")
         print()
 
 
@@ -6,12 +6,21 @@ Exports directly to Google Sheets.
 """
 
 import json
+import re
 import ssl
 import sys
 import urllib.parse
+from collections import namedtuple
 from datetime import datetime
-from urllib.request import urlopen, Request
 
+import urllib3
+
+# orjson decodes the Socrata pages faster; both accept raw bytes
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 
@@ -24,6 +33,18 @@ except ImportError:
     SSL_CTX.check_hostname = False
     SSL_CTX.verify_mode = ssl.CERT_NONE
 
+# One keep-alive pool for every fetch; responses come back gzipped and
+# transient gateway errors are retried
+HTTP = urllib3.PoolManager(
+    num_pools=4, maxsize=10, ssl_context=SSL_CTX,
+    retries=urllib3.Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    headers={
+        "User-Agent": "TxDOTContractScraper/1.0",
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip",
+    },
+)
+
 # --- Config ---
 # Socrata API endpoint for Texas Bid Tabulations dataset
 SOCRATA_ENDPOINT = "https://data.texas.gov/resource/de7b-7dna.json"
@@ -31,6 +52,7 @@ SOCRATA_ENDPOINT = "https://data.texas.gov/resource/de7b-7dna.json"
 # Filter settings
 MIN_AMOUNT = 1_000_000  # Bid amount >= $1M
 FILTER_YEAR = 2026      # Contracts let in 2026
+PAGE_SIZE = 2000        # Socrata rows per request
 
 # Google Sheets config (same as other scrapers)
 SERVICE_ACCOUNT_FILE = "service-account-key.json"
@@ -41,6 +63,15 @@ SHEET_NAME = "Webscraper Tool for Procurement Sites Two"
 DATASET_URL = "https://data.texas.gov/Transportation/Bid-Tabulations/de7b-7dna"
 
 
+SOCRATA_SELECT = ",".join(["vendor_name", "project_id"] + [
+    f"max({col}) AS {col}"
+    for col in (
+        "bid_total_amount", "project_name", "short_description",
+        "project_actual_let_date", "county", "district_division", "highway",
+    )
+])
+
+
 def build_soql_query():
     """Build the SoQL $where clause for filtering."""
     conditions = [
@@ -52,46 +83,55 @@ def build_soql_query():
 
 
 def fetch_from_socrata():
-    """Fetch data from Socrata API with SoQL filters and grouping."""
+    """Yield rows from Socrata API with SoQL filters and grouping, one page at a time."""
     where_clause = build_soql_query()
 
-    # Select distinct projects (the dataset has multiple rows per project for each bid item)
+    # One row per (vendor, project): the dataset has a row per bid item, so
+    # Socrata groups them server-side and max() collapses the project columns
     params = {
         "$where": where_clause,
-        "$select": "vendor_name,bid_total_amount,project_name,short_description,project_actual_let_date,county,district_division,highway,project_id",
-        "$group": "vendor_name,bid_total_amount,project_name,short_description,project_actual_let_date,county,district_division,highway,project_id",
-        "$limit": 10000,
+        "$select": SOCRATA_SELECT,
+        "$group": "vendor_name,project_id",
+        "$order": "project_id,vendor_name",  # stable paging
+        "$limit": PAGE_SIZE,
     }
-    url = f"{SOCRATA_ENDPOINT}?{urllib.parse.urlencode(params)}"
 
     print(f"Socrata API Query:")
     print(f"  $where={where_clause}")
     print(f"Fetching from: {SOCRATA_ENDPOINT}")
 
-    req = Request(url, headers={
-        "User-Agent": "TxDOTContractScraper/1.0",
-        "Accept": "application/json",
-    })
-    with urlopen(req, context=SSL_CTX, timeout=120) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+    offset = 0
+    while True:
+        params["$offset"] = offset
+        url = f"{SOCRATA_ENDPOINT}?{urllib.parse.urlencode(params)}"
+        resp = HTTP.request("GET", url, timeout=120)
+        if resp.status != 200:
+            raise urllib3.exceptions.HTTPError(f"Socrata returned HTTP {resp.status}")
+        batch = _loads(resp.data)
+        yield from batch
+        if len(batch) < PAGE_SIZE:
+            break
+        offset += PAGE_SIZE
 
 
 def parse_date(date_str):
     """Parse Socrata date format (ISO 8601)."""
     if not date_str:
         return None
+    # Fixed-width YYYY-MM-DD prefix; slicing is much cheaper than strptime
     try:
-        return datetime.strptime(date_str[:10], "%Y-%m-%d")
+        return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
     except ValueError:
         return None
 
 
+_AMOUNT_TRANS = str.maketrans("", "", ",$")
+
+
 def parse_amount(amount_str):
     """Parse dollar amount string."""
-    if not amount_str:
-        return 0.0
     try:
-        return float(str(amount_str).replace(",", "").replace("$", ""))
+        return float(str(amount_str).translate(_AMOUNT_TRANS))
     except ValueError:
         return 0.0
 
@@ -101,27 +141,25 @@ def build_description(row):
     parts = []
 
     # Short description is the main work type
-    short_desc = row.get("short_description", "").strip()
+    short_desc = (row.get("short_description") or "").strip()
     if short_desc:
         parts.append(short_desc)
 
     # Project name adds context
-    proj_name = row.get("project_name", "").strip()
-    if proj_name and proj_name.lower() != short_desc.lower():
+    proj_name = (row.get("project_name") or "").strip()
+    if proj_name and proj_name.casefold() != short_desc.casefold():
         parts.append(proj_name)
 
     # Highway info
-    highway = row.get("highway", "").strip()
+    highway = (row.get("highway") or "").strip()
     if highway:
         parts.append(f"Hwy: {highway}")
 
     # Location
-    county = row.get("county", "").strip()
-    district = row.get("district_division", "").strip()
-    if county and district:
-        parts.append(f"{county} County, {district} District")
-    elif county:
-        parts.append(f"{county} County")
+    county = (row.get("county") or "").strip()
+    if county:
+        district = (row.get("district_division") or "").strip()
+        parts.append(f"{county} County, {district} District" if district else f"{county} County")
 
     return " | ".join(parts) if parts else "TxDOT Construction Contract"
 
@@ -135,44 +173,30 @@ def build_award_link(project_id):
 
 def scrape_all():
     """Main scrape pipeline: fetch from Socrata API -> transform -> return results."""
-    data = fetch_from_socrata()
-
-    print(f"\n--- Socrata API returned {len(data)} records ---")
-
+    # Rows are already unique per (vendor_name, project_id) via $group
     results = []
-    seen = set()
 
-    for row in data:
+    for row in fetch_from_socrata():
         vendor = row.get("vendor_name", "")
         project_id = row.get("project_id", "")
 
-        # Deduplicate by vendor + project
-        dedup_key = (vendor, project_id)
-        if dedup_key in seen:
-            continue
-        seen.add(dedup_key)
-
         let_date = parse_date(row.get("project_actual_let_date", ""))
         bid_amount = parse_amount(row.get("bid_total_amount", "0"))
 
-        results.append({
-            "company_name": vendor,
-            "contract_name": row.get("project_name", ""),
-            "award_amount": bid_amount,
-            "amount_expended": 0.0,  # Not available in bid data
-            "begin_date": let_date.strftime("%Y-%m-%d") if let_date else "",
-            "award_link": build_award_link(project_id),
-            "description": build_description(row),
-            "commodity_type": "Highway/Transportation Construction",
-            "contact_name": "",  # Not available
-            "address": "",       # Not available
-            "phone": "",         # Not available
-            "email": "",         # Not available
-            "website": "",       # Not available
-            "city": "Texas (TxDOT)",
-        })
-
-    print(f"After deduplication: {len(results)} unique contracts")
+        results.append(SheetRow(
+            city="Texas (TxDOT)",
+            company_name=vendor,
+            contract_name=row.get("project_name", ""),
+            award_amount=bid_amount,
+            amount_expended=0.0,  # Not available in bid data
+            begin_date=let_date.strftime("%Y-%m-%d") if let_date else "",
+            award_link=build_award_link(project_id),
+            description=build_description(row),
+            commodity_type="Highway/Transportation Construction",
+            # contact_name/address/phone/email/website not available
+        ))
+
+    print(f"\n--- Socrata API returned {len(results)} unique contracts ---")
     return results
 
 
@@ -190,6 +214,10 @@ SHEET_HEADERS = [
     "Award Link", "Project Description", "Commodity Type",
 ]
 
+# Results are positional rows in SHEET_FIELDS order, so they go to the
+# Sheets API as-is; blank columns default to "".
+SheetRow = namedtuple("SheetRow", SHEET_FIELDS, defaults=("",) * len(SHEET_FIELDS))
+
 
 def get_sheets_service():
     """Authenticate and return Google Sheets API service."""
@@ -201,16 +229,107 @@ def get_sheets_service():
 
 
 def get_existing_data(service):
-    """Fetch existing data from the sheet to append to."""
-    sheet = service.spreadsheets()
+    """Fetch existing data from the sheet to append to.
+
+    API errors propagate: treating a failed read as an empty sheet would
+    re-append the header and every row, and poison .sheet_cache.json.
+    """
+    result = service.spreadsheets().values().get(
+        spreadsheetId=SPREADSHEET_ID,
+        range=f"'{SHEET_NAME}'!A:N",
+    ).execute()
+    return result.get("values", [])
+
+
+# Local copy of the sheet's dedup fingerprints. Re-runs only read the rows
+# added since the last sync instead of the whole A:N range.
+SHEET_CACHE_FILE = ".sheet_cache.json"
+_SHEET_CACHE_KEY = f"{SPREADSHEET_ID}:{SHEET_NAME}"
+_UPDATED_ROW_RE = re.compile(r"(\d+)$")
+
+
+def _row_fp(row):
+    """(company_name, contract_name) fingerprint of a sheet row, or None if too short."""
+    if len(row) > 7:
+        return (str(row[1]).strip().lower(), str(row[7]).strip().lower())
+    return None
+
+
+def _load_sheet_cache():
+    try:
+        with open(SHEET_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_sheet_cache(fps, row_count, last_row):
+    cache = _load_sheet_cache()
+    cache[_SHEET_CACHE_KEY] = {
+        "row_count": row_count,
+        "last": _row_fp(last_row),
+        "fps": sorted(fps),
+    }
     try:
-        result = sheet.values().get(
+        with open(SHEET_CACHE_FILE, "w") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"  Warning: could not save {SHEET_CACHE_FILE}: {e}")
+
+
+def get_existing_fingerprints(service):
+    """Return (fingerprints, row_count, last_row) for the sheet.
+
+    Uses the local cache plus a read of rows added since the last sync; falls
+    back to a full read if the cache is missing or the sheet changed above
+    the last synced row.
+    """
+    cached = _load_sheet_cache().get(_SHEET_CACHE_KEY)
+    if cached and cached["row_count"] > 0:
+        row_count = cached["row_count"]
+        try:
+            result = service.spreadsheets().values().get(
+                spreadsheetId=SPREADSHEET_ID,
+                range=f"'{SHEET_NAME}'!A{row_count}:N",
+            ).execute()
+            tail = result.get("values", [])
+        except Exception:
+            tail = []
+        last = tuple(cached["last"]) if cached["last"] else None
+        if tail and _row_fp(tail[0]) == last:
+            fps = {tuple(fp) for fp in cached["fps"]}
+            fps.update(fp for fp in map(_row_fp, tail[1:]) if fp)
+            return fps, row_count + len(tail) - 1, tail[-1]
+
+    existing = get_existing_data(service)
+    fps = {fp for fp in map(_row_fp, existing[1:]) if fp}
+    return fps, len(existing), existing[-1] if existing else []
+
+
+# Sheet title -> sheetId, so repeat writes skip the metadata RPC
+_SHEET_ID_CACHE = {}
+
+
+def ensure_sheet(sheet):
+    """Return the target sheet's ID, creating the sheet if it doesn't exist."""
+    if SHEET_NAME in _SHEET_ID_CACHE:
+        return _SHEET_ID_CACHE[SHEET_NAME]
+
+    spreadsheet = sheet.get(
+        spreadsheetId=SPREADSHEET_ID, fields="sheets.properties(sheetId,title)"
+    ).execute()
+    for s in spreadsheet.get("sheets", []):
+        _SHEET_ID_CACHE[s["properties"]["title"]] = s["properties"]["sheetId"]
+
+    if SHEET_NAME not in _SHEET_ID_CACHE:
+        reply = sheet.batchUpdate(
             spreadsheetId=SPREADSHEET_ID,
-            range=f"'{SHEET_NAME}'!A:N"
+            body={"requests": [{"addSheet": {"properties": {"title": SHEET_NAME}}}]},
         ).execute()
-        return result.get("values", [])
-    except Exception:
-        return []
+        _SHEET_ID_CACHE[SHEET_NAME] = reply["replies"][0]["addSheet"]["properties"]["sheetId"]
+        print(f"Created new sheet: {SHEET_NAME}")
+
+    return _SHEET_ID_CACHE[SHEET_NAME]
 
 
 def write_to_google_sheets(results):
@@ -218,69 +337,42 @@ def write_to_google_sheets(results):
     service = get_sheets_service()
     sheet = service.spreadsheets()
 
-    # Get the sheet ID for our target sheet
-    spreadsheet = sheet.get(spreadsheetId=SPREADSHEET_ID).execute()
-    sheet_id = None
-    for s in spreadsheet.get("sheets", []):
-        if s["properties"]["title"] == SHEET_NAME:
-            sheet_id = s["properties"]["sheetId"]
-            break
-
-    if sheet_id is None:
-        # Create the sheet if it doesn't exist
-        request = {
-            "requests": [{
-                "addSheet": {
-                    "properties": {"title": SHEET_NAME}
-                }
-            }]
-        }
-        sheet.batchUpdate(spreadsheetId=SPREADSHEET_ID, body=request).execute()
-        print(f"Created new sheet: {SHEET_NAME}")
+    ensure_sheet(sheet)
 
     # APPEND ONLY — never clear the sheet.
     # Deduplicates by (company_name, contract_name) to avoid double-writing.
-    existing = get_existing_data(service)
-    start_row = len(existing) + 1
+    existing_fps, row_count, last_row = get_existing_fingerprints(service)
 
-    existing_fps = {
-        (row[1].strip().lower(), row[7].strip().lower())
-        for row in (existing[1:] if len(existing) > 1 else [])
-        if len(row) > 7
-    }
     new_results = [
         r for r in results
-        if (r.get("company_name", "").strip().lower(),
-            r.get("contract_name", "").strip().lower()) not in existing_fps
+        if (r.company_name.strip().lower(),
+            r.contract_name.strip().lower()) not in existing_fps
     ]
     if len(new_results) < len(results):
         print(f"  Skipped {len(results) - len(new_results)} already-existing entries")
     results = new_results
 
-    # If sheet is empty, add headers first
-    if not existing:
-        header_range = f"'{SHEET_NAME}'!A1"
-        sheet.values().update(
-            spreadsheetId=SPREADSHEET_ID,
-            range=header_range,
-            valueInputOption="RAW",
-            body={"values": [SHEET_HEADERS]}
-        ).execute()
-        start_row = 2
-
-    # Build data rows
-    rows = []
-    for r in results:
-        rows.append([r.get(f, "") for f in SHEET_FIELDS])
+    # SheetRows are already positional; if sheet is empty, the header row
+    # goes out in the same append
+    rows = [SHEET_HEADERS, *results] if row_count == 0 else results
 
     if rows:
-        write_range = f"'{SHEET_NAME}'!A{start_row}"
-        sheet.values().update(
+        # Server appends after the last row of the table — no offset to compute
+        reply = sheet.values().append(
             spreadsheetId=SPREADSHEET_ID,
-            range=write_range,
+            range=f"'{SHEET_NAME}'!A1",
             valueInputOption="RAW",
-            body={"values": rows}
+            insertDataOption="INSERT_ROWS",
+            body={"values": rows},
         ).execute()
+        updated = reply.get("updates", {}).get("updatedRange", "")
+        m = _UPDATED_ROW_RE.search(updated)
+        row_count = int(m.group(1)) if m else row_count + len(rows)
+        last_row = rows[-1]
+        existing_fps.update(fp for fp in map(_row_fp, results) if fp)
+
+    if row_count:
+        _save_sheet_cache(existing_fps, row_count, last_row)
 
     print(f"Wrote {len(results)} rows to Google Sheet: {SHEET_NAME}")
 
@@ -289,11 +381,11 @@ def preview_results(results, limit=10):
     """Print a preview of the results."""
     print(f"\n--- Preview (first {min(limit, len(results))} results) ---\n")
     for i, r in enumerate(results[:limit], 1):
-        print(f"{i}. {r['company_name']}")
-        print(f"   Contract: {r['contract_name']}")
-        print(f"   Bid: ${r['award_amount']:,.2f}")
-        print(f"   Date: {r['begin_date']}")
-        print(f"   Description: {r['description'][:80]}...")
+        print(f"{i}. {r.company_name}")
+        print(f"   Contract: {r.contract_name}")
+        print(f"   Bid: ${r.award_amount:,.2f}")
+        print(f"   Date: {r.begin_date}")
+        print(f"   Description: {r.description[:80]}...")
         print()
 
 
@@ -10,12 +10,23 @@ import html
 import re
 import ssl
 import sys
+import threading
 import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from urllib.request import urlopen, Request
+from functools import lru_cache
 
+import urllib3
+from selectolax.lexbor import LexborHTMLParser
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
+from googleapiclient.model import JsonModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # --- SSL setup (macOS Python often lacks default certs) ---
 try:
@@ -26,12 +37,23 @@ except ImportError:
     SSL_CTX.check_hostname = False
     SSL_CTX.verify_mode = ssl.CERT_NONE
 
+# Every fetch goes to www.txsmartbuy.gov; keep-alive reuses the TLS session
+HTTP = urllib3.PoolManager(
+    num_pools=1, maxsize=4, ssl_context=SSL_CTX,
+    headers={
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Encoding": "gzip",
+    },
+)
+
 # --- Config ---
 BASE_URL = "https://www.txsmartbuy.gov"
 LIST_URL = f"{BASE_URL}/browsecontracts?filterBy=TXMAS&page=1"
 MIN_START_DATE = datetime(2026, 1, 1)  # Contracts starting Jan 1, 2026+
 MIN_END_DATE = datetime(2026, 1, 1)    # OR contracts still active in 2026
-REQUEST_DELAY = 0.5  # seconds between requests
+REQUEST_DELAY = 0.5  # seconds between request starts
+DETAIL_WORKERS = 4   # concurrent detail-page fetches
 
 # Google Sheets config
 SERVICE_ACCOUNT_FILE = "service-account-key.json"
@@ -65,91 +87,186 @@ NAICS_FILTERS = [
 ]
 
 
+_throttle_lock = threading.Lock()
+_next_request_at = 0.0
+
+
+def throttle():
+    """Space request starts at least REQUEST_DELAY apart, across threads."""
+    global _next_request_at
+    with _throttle_lock:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + REQUEST_DELAY
+    if wait > 0:
+        time.sleep(wait)
+
+
 def fetch_page(url):
     """Fetch a URL and return decoded HTML."""
-    req = Request(url, headers={
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    })
-    with urlopen(req, context=SSL_CTX, timeout=30) as resp:
-        return resp.read().decode("utf-8", errors="replace")
+    throttle()
+    resp = HTTP.request("GET", url, timeout=30)
+    if resp.status != 200:
+        raise urllib3.exceptions.HTTPError(f"HTTP {resp.status} for {url}")
+    return resp.data.decode("utf-8", errors="replace")
 
 
+@lru_cache(maxsize=4096)
 def parse_date(date_str):
     """Parse date string in M/D/YYYY format."""
     if not date_str:
         return None
+    # Hand-parsed M/D/YYYY (or M/D/YY with strptime's 69-99 -> 19xx pivot)
     try:
-        return datetime.strptime(date_str.strip(), "%m/%d/%Y")
-    except ValueError:
-        try:
-            return datetime.strptime(date_str.strip(), "%m/%d/%y")
-        except ValueError:
+        month, day, year = date_str.strip().split("/")
+        if len(year) == 2:
+            year = int(year) + (1900 if int(year) >= 69 else 2000)
+        elif len(year) == 4:
+            year = int(year)
+        else:
             return None
+        return datetime(year, int(month), int(day))
+    except ValueError:
+        return None
+
+
+# Every keyword in one alternation, each mapped back to its category's
+# position in NAICS_FILTERS. The lookahead reports overlapping hits, so a
+# single scan sees every keyword the old nested loop would have.
+_NAICS_KEYWORD_INDEX = {}
+for _i, (_code, _label, _keywords) in enumerate(NAICS_FILTERS):
+    for _kw in _keywords:
+        _NAICS_KEYWORD_INDEX.setdefault(_kw, _i)
+NAICS_RE = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in sorted(_NAICS_KEYWORD_INDEX, key=len, reverse=True)) + "))"
+)
 
 
 def match_naics(text):
     """Match text against NAICS keywords."""
-    lower = text.lower()
-    for code, label, keywords in NAICS_FILTERS:
-        for kw in keywords:
-            if kw in lower:
-                return code, label
-    return None, None
+    best = None
+    for m in NAICS_RE.finditer(text.lower()):
+        idx = _NAICS_KEYWORD_INDEX[m.group(1)]
+        if best is None or idx < best:
+            best = idx
+            if best == 0:
+                break
+    if best is None:
+        return None, None
+    code, label, _ = NAICS_FILTERS[best]
+    return code, label
+
+
+# --- HTML patterns ---
+ROW_SELECTOR = "div.browse-contract-search-result-line"
+# List-page columns read by extract_cells, with their lowercased label suffix
+CELL_HEADERS = ["Contract #", "Description", "Contract Type", "Category", "Start Date", "End Date", "NIGP(s)"]
+CELL_LABELS = [(header, header.lower() + ":") for header in CELL_HEADERS]
+DETAIL_URL_RE = re.compile(r'/browsecontracts/\d+')
+CONTRACTOR_RE = re.compile(
+    r'<h\d[^>]*>([^<]+)</h\d>\s*(?:<[^>]+>\s*)*VID:\s*(\d+)',
+    re.IGNORECASE | re.DOTALL
+)
+# Cheap literal check run before CONTRACTOR_RE; a page without a VID can't match
+VID_RE = re.compile(r'VID:\s*\d', re.IGNORECASE)
+EMAIL_RE = re.compile(r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})')
+PHONE_RE = re.compile(r'(\d{3}[-.]?\d{3}[-.]?\d{4})')
+AMOUNT_RE = re.compile(r'\$\s*([\d,]+(?:\.\d{2})?)')
+
+
+def unescape(text):
+    """html.unescape, skipped when the text has no entities."""
+    return html.unescape(text) if '&' in text else text
+
+
+def extract_cells(row):
+    """Map each of CELL_HEADERS to the text of the span after its label span.
+
+    A label matches when its text ends in "Header:" (case-insensitive), the
+    first such label winning, so "Category" also picks up a preceding
+    "Contract Category:" label the way the old `Category:</span>` regex did.
+    """
+    cells = {}
+    spans = row.css("span")
+    for label, value in zip(spans, spans[1:]):
+        text = label.text().strip().lower()
+        if not text.endswith(":"):
+            continue
+        for header, suffix in CELL_LABELS:
+            if header in cells or not text.endswith(suffix):
+                continue
+            # A linked value (e.g. the contract number) uses the link text
+            link = value.css_first("a")
+            link_text = link.text().strip() if link else ""
+            cells[header] = link_text or value.text().strip()
+    return cells
+
+
+def extract_detail_url(row):
+    """Extract the contract detail page URL."""
+    for link in row.css('a[href^="/browsecontracts/"]'):
+        href = link.attributes.get("href") or ""
+        if DETAIL_URL_RE.fullmatch(href):
+            return BASE_URL + href
+    return ""
 
 
 def parse_contracts_list():
-    """Parse the contracts list page."""
+    """Parse the contracts list page, keeping rows active in 2026 with a NAICS match.
+
+    Returns (qualified, total, skipped_date, skipped_naics), where qualified
+    holds (contract, start_date, naics_code, naics_label) tuples.
+    """
     print(f"Fetching contracts from: {LIST_URL}")
     page = fetch_page(LIST_URL)
 
-    contracts = []
+    qualified = []
+    total = skipped_date = skipped_naics = 0
 
-    # Parse the contract rows from the HTML
-    row_pattern = re.compile(
-        r'<div class="browse-contract-search-result-line"[^>]*>(.*?)</div>\s*(?=<div class="browse-contract-search-result-line"|<div class="browse-contract-search-list-paginator")',
-        re.DOTALL | re.IGNORECASE
-    )
+    # Entities are decoded by the parser; cells are looked up by header label.
+    # Dates and description are checked first so rejected rows never get a
+    # contract dict or a detail-URL lookup.
+    for row in LexborHTMLParser(page).css(ROW_SELECTOR):
+        cells = extract_cells(row)
+        if not cells.get("Contract #"):
+            continue
+        total += 1
 
-    rows = row_pattern.findall(page)
-
-    def extract_cell(row_html, header_text):
-        """Extract cell value after a specific header."""
-        pattern = rf'{re.escape(header_text)}:</span>\s*<span[^>]*>([^<]*(?:<a[^>]*>([^<]*)</a>)?[^<]*)</span>'
-        match = re.search(pattern, row_html, re.IGNORECASE | re.DOTALL)
-        if match:
-            text = match.group(2) if match.group(2) else match.group(1)
-            text = re.sub(r'<[^>]+>', '', text)
-            return html.unescape(text.strip())
-        return ""
-
-    def extract_detail_url(row_html):
-        """Extract the contract detail page URL."""
-        match = re.search(r'href="(/browsecontracts/\d+)"', row_html)
-        if match:
-            return BASE_URL + match.group(1)
-        return ""
-
-    for row_html in rows:
-        nigp_match = re.search(r'NIGP\(s\):</span>\s*<span[^>]*>([^<]+)</span>', row_html, re.IGNORECASE)
-        nigp_codes = html.unescape(nigp_match.group(1).strip()) if nigp_match else ""
+        # Filter by date - contract must be active in 2026 (started in 2026 OR end date >= 2026)
+        start_date = parse_date(cells.get("Start Date", ""))
+        end_date = parse_date(cells.get("End Date", ""))
+
+        # Contract qualifies if:
+        # - Start date is in 2026+ OR
+        # - End date is in 2026+ (meaning contract is still active in 2026)
+        start_qualifies = start_date and start_date >= MIN_START_DATE
+        end_qualifies = end_date and end_date >= MIN_END_DATE
+
+        if not (start_qualifies or end_qualifies):
+            skipped_date += 1
+            continue
+
+        # Check NAICS match on description
+        description = cells.get("Description", "")
+        naics_code, naics_label = match_naics(description)
+        if not naics_code:
+            skipped_naics += 1
+            continue
 
         contract = {
-            "contract_number": extract_cell(row_html, "Contract #"),
-            "description": extract_cell(row_html, "Description"),
-            "contract_type": extract_cell(row_html, "Contract Type"),
-            "contract_category": extract_cell(row_html, "Category"),
-            "start_date": extract_cell(row_html, "Start Date"),
-            "end_date": extract_cell(row_html, "End Date"),
-            "nigp_codes": nigp_codes,
-            "detail_url": extract_detail_url(row_html),
+            "contract_number": cells["Contract #"],
+            "description": description,
+            "contract_type": cells.get("Contract Type", ""),
+            "contract_category": cells.get("Category", ""),
+            "start_date": cells.get("Start Date", ""),
+            "end_date": cells.get("End Date", ""),
+            "nigp_codes": cells.get("NIGP(s)", ""),
+            "detail_url": extract_detail_url(row),
         }
+        qualified.append((contract, start_date, naics_code, naics_label))
 
-        if contract["contract_number"]:
-            contracts.append(contract)
-
-    print(f"Found {len(contracts)} contracts on page")
-    return contracts
+    print(f"Found {total} contracts on page")
+    return qualified, total, skipped_date, skipped_naics
 
 
 def parse_contract_detail(url):
@@ -160,23 +277,17 @@ def parse_contract_detail(url):
 
     # Find contractor blocks - they contain VID numbers
     # Pattern: Company name followed by VID
-    contractor_pattern = re.compile(
-        r'<h\d[^>]*>([^<]+)</h\d>\s*(?:<[^>]+>\s*)*VID:\s*(\d+)',
-        re.IGNORECASE | re.DOTALL
-    )
-
-    for match in contractor_pattern.finditer(page):
-        name = html.unescape(match.group(1).strip())
+    matches = CONTRACTOR_RE.finditer(page) if VID_RE.search(page) else ()
+    for match in matches:
+        name = unescape(match.group(1).strip())
         vid = match.group(2).strip()
 
         # Extract contact info for this contractor
         # Look for email and phone near the VID
         block_start = match.start()
         block_end = min(match.end() + 2000, len(page))
-        block = page[block_start:block_end]
-
-        email_match = re.search(r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', block)
-        phone_match = re.search(r'(\d{3}[-.]?\d{3}[-.]?\d{4})', block)
+        email_match = EMAIL_RE.search(page, block_start, block_end)
+        phone_match = PHONE_RE.search(page, block_start, block_end)
 
         contractors.append({
             "name": name,
@@ -187,12 +298,13 @@ def parse_contract_detail(url):
 
     # Also try alternative pattern for contractor names
     if not contractors:
-        alt_pattern = re.compile(
-            r'class="[^"]*contractor[^"]*"[^>]*>([^<]+)<',
-            re.IGNORECASE
-        )
-        for match in alt_pattern.finditer(page):
-            name = html.unescape(match.group(1).strip())
+        for node in LexborHTMLParser(page).css('[class*="contractor" i]'):
+            # Only the text right after the opening tag, as the old
+            # `class="...contractor..."[^>]*>([^<]+)<` pattern captured
+            first = node.child
+            if first is None or first.tag != "-text":
+                continue
+            name = first.text().strip()
             if name and len(name) > 2:
                 contractors.append({
                     "name": name,
@@ -202,7 +314,7 @@ def parse_contract_detail(url):
                 })
 
     # Extract any award amounts (if present)
-    amount_match = re.search(r'\$\s*([\d,]+(?:\.\d{2})?)', page)
+    amount_match = AMOUNT_RE.search(page)
     award_amount = amount_match.group(1) if amount_match else ""
 
     return {
@@ -213,73 +325,66 @@ def parse_contract_detail(url):
 
 def scrape_all():
     """Main scrape pipeline with filtering."""
-    contracts = parse_contracts_list()
-    if not contracts:
+    qualified, total, skipped_date, skipped_naics = parse_contracts_list()
+    if not total:
         print("No contracts found on list page.")
         return []
 
     results = []
-    skipped_date = 0
-    skipped_naics = 0
     errors = 0
 
-    for i, c in enumerate(contracts, 1):
-        # Filter by date - contract must be active in 2026 (started in 2026 OR end date >= 2026)
-        start_date = parse_date(c["start_date"])
-        end_date = parse_date(c["end_date"])
-
-        # Contract qualifies if:
-        # - Start date is in 2026+ OR
-        # - End date is in 2026+ (meaning contract is still active in 2026)
-        start_qualifies = start_date and start_date >= MIN_START_DATE
-        end_qualifies = end_date and end_date >= MIN_END_DATE
-
-        if not (start_qualifies or end_qualifies):
-            skipped_date += 1
-            continue
-
-        # Check NAICS match on description
-        naics_code, naics_label = match_naics(c["description"])
-        if not naics_code:
-            skipped_naics += 1
-            continue
-
-        print(f"  [{i}/{len(contracts)}] Fetching: {c['contract_number']} - {c['description'][:50]}...")
-
-        # Fetch detail page for contractor info
-        detail_info = {"contractors": [], "award_amount": ""}
-        if c["detail_url"]:
-            try:
-                detail_info = parse_contract_detail(c["detail_url"])
-                time.sleep(REQUEST_DELAY)
-            except Exception as e:
-                print(f"    ERROR fetching detail: {e}")
-                errors += 1
+    def fetch_detail(i, c):
+        print(f"  [{i}/{len(qualified)}] Fetching: {c['contract_number']} - {c['description'][:50]}...")
+        if not c["detail_url"]:
+            return {"contractors": [], "award_amount": ""}, None
+        try:
+            return parse_contract_detail(c["detail_url"]), None
+        except Exception as e:
+            print(f"    ERROR fetching detail for {c['contract_number']}: {e}")
+            return {"contractors": [], "award_amount": ""}, e
+
+    # Detail pages are fetched concurrently; fetch_page spaces request
+    # starts REQUEST_DELAY apart so the site sees the same request rate.
+    # Progress and errors print from the worker as each fetch runs.
+    with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as pool:
+        details = list(pool.map(
+            fetch_detail, range(1, len(qualified) + 1), [q[0] for q in qualified]
+        ))
+
+    for (c, start_date, naics_code, naics_label), (detail_info, err) in zip(qualified, details):
+        if err is not None:
+            errors += 1
 
         # Create a result row for each contractor (or one row if no contractors found)
         contractor_list = detail_info["contractors"] if detail_info["contractors"] else [{"name": "", "vid": "", "email": "", "phone": ""}]
 
+        # Same for every contractor row; contracts that only qualify on their
+        # end date may have no parseable start date
+        start_iso = (
+            f"{start_date.year:04d}-{start_date.month:02d}-{start_date.day:02d}"
+            if start_date else ""
+        )
+
         for contractor in contractor_list:
-            results.append({
-                "contract_number": c["contract_number"],
-                "description": c["description"],
-                "contract_type": c["contract_type"],
-                "contract_category": c["contract_category"],
-                "start_date": start_date.strftime("%Y-%m-%d"),
-                "end_date": c["end_date"],
-                "nigp_codes": c["nigp_codes"],
-                "naics_code": naics_code,
-                "naics_category": naics_label,
-                "contractor_name": contractor["name"],
-                "contractor_vid": contractor["vid"],
-                "contractor_email": contractor["email"],
-                "contractor_phone": contractor["phone"],
-                "award_amount": detail_info["award_amount"],
-                "detail_url": c["detail_url"],
-            })
+            results.append(SheetRow(
+                contract_number=c["contract_number"],
+                description=c["description"],
+                contract_type=c["contract_type"],
+                contract_category=c["contract_category"],
+                start_date=start_iso,
+                end_date=c["end_date"],
+                nigp_codes=c["nigp_codes"],
+                naics_code=naics_code,
+                naics_category=naics_label,
+                contractor_name=contractor["name"],
+                contractor_email=contractor["email"],
+                contractor_phone=contractor["phone"],
+                award_amount=detail_info["award_amount"],
+                detail_url=c["detail_url"],
+            ))
 
     print(f"\n--- Summary ---")
-    print(f"Total on list page:  {len(contracts)}")
+    print(f"Total on list page:  {total}")
     print(f"Skipped (not active in 2026): {skipped_date}")
     print(f"Skipped (no NAICS match): {skipped_naics}")
     print(f"Errors:              {errors}")
@@ -301,6 +406,20 @@ SHEET_HEADERS = [
     "Contract Type", "Contract Category", "Contract URL",
 ]
 
+# Results are positional rows in SHEET_FIELDS order, so they go to the
+# Sheets API as-is; blank columns default to "".
+SheetRow = namedtuple("SheetRow", SHEET_FIELDS, defaults=("",) * len(SHEET_FIELDS))
+
+
+class OrjsonModel(JsonModel):
+    """JsonModel that encodes request bodies with orjson (large values payloads)."""
+
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and "data" not in body_value and self._data_wrapper:
+            body_value = {"data": body_value}
+        # orjson rejects tuple subclasses, so SheetRows go out as lists
+        return orjson.dumps(body_value, default=list).decode()
+
 
 def get_sheets_service():
     """Authenticate and return Google Sheets API service."""
@@ -308,20 +427,60 @@ def get_sheets_service():
         SERVICE_ACCOUNT_FILE,
         scopes=["https://www.googleapis.com/auth/spreadsheets"]
     )
-    return build("sheets", "v4", credentials=creds)
+    # Fall back to the client's stdlib-json model when orjson isn't installed
+    model = OrjsonModel() if orjson else None
+    return build("sheets", "v4", credentials=creds, model=model)
 
 
-def get_existing_data(service):
-    """Fetch existing data from the sheet to append to."""
-    sheet = service.spreadsheets()
-    try:
-        result = sheet.values().get(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f"'{SHEET_NAME}'!A:Z"
+def has_header_row(service):
+    """Return True if the sheet already has something in its first row.
+
+    API errors propagate; guessing "empty" would drop a header row into the
+    middle of existing data.
+    """
+    result = service.spreadsheets().values().get(
+        spreadsheetId=SPREADSHEET_ID,
+        range=f"'{SHEET_NAME}'!A1:N1"
+    ).execute()
+    return bool(result.get("values"))
+
+
+_SHEET_ID_CACHE = {}
+
+
+def get_sheet_ids(sheet):
+    """Return {title: sheetId} for the spreadsheet, fetched once per process."""
+    if not _SHEET_ID_CACHE:
+        spreadsheet = sheet.get(
+            spreadsheetId=SPREADSHEET_ID, fields="sheets.properties(sheetId,title)"
         ).execute()
-        return result.get("values", [])
-    except Exception:
-        return []
+        for s in spreadsheet.get("sheets", []):
+            _SHEET_ID_CACHE[s["properties"]["title"]] = s["properties"]["sheetId"]
+    return _SHEET_ID_CACHE
+
+
+def create_sheet_with_rows(sheet, rows):
+    """Create the sheet and write rows into it with a single batchUpdate."""
+    sheet_ids = get_sheet_ids(sheet)
+    sheet_id = max(sheet_ids.values(), default=0) + 1
+    requests = [
+        {"addSheet": {"properties": {
+            "sheetId": sheet_id,
+            "title": SHEET_NAME,
+            "gridProperties": {"rowCount": max(1000, len(rows)), "columnCount": 26},
+        }}},
+        {"updateCells": {
+            "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+            "rows": [
+                {"values": [{"userEnteredValue": {"stringValue": str(v)}} for v in row]}
+                for row in rows
+            ],
+            "fields": "userEnteredValue",
+        }},
+    ]
+    sheet.batchUpdate(spreadsheetId=SPREADSHEET_ID, body={"requests": requests}).execute()
+    sheet_ids[SHEET_NAME] = sheet_id
+    print(f"Created new sheet: {SHEET_NAME}")
 
 
 def write_to_google_sheets(results):
@@ -329,44 +488,24 @@ def write_to_google_sheets(results):
     service = get_sheets_service()
     sheet = service.spreadsheets()
 
-    spreadsheet = sheet.get(spreadsheetId=SPREADSHEET_ID).execute()
-    sheet_id = None
-    for s in spreadsheet.get("sheets", []):
-        if s["properties"]["title"] == SHEET_NAME:
-            sheet_id = s["properties"]["sheetId"]
-            break
-
-    if sheet_id is None:
-        request = {
-            "requests": [{
-                "addSheet": {
-                    "properties": {"title": SHEET_NAME}
-                }
-            }]
-        }
-        sheet.batchUpdate(spreadsheetId=SPREADSHEET_ID, body=request).execute()
-        print(f"Created new sheet: {SHEET_NAME}")
-
-    # APPEND ONLY — never clear the sheet.
-    # Deduplicates by (company_name, contract_name) to avoid double-writing.
-    existing = get_existing_data(service)
-    start_row = len(existing) + 1
+    rows = list(results)
 
-    if not existing:
-        sheet.values().update(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f"'{SHEET_NAME}'!A1",
-            valueInputOption="RAW",
-            body={"values": [SHEET_HEADERS]}
-        ).execute()
-        start_row = 2
+    # New sheet: addSheet + header + data go out in one batchUpdate
+    if SHEET_NAME not in get_sheet_ids(sheet):
+        create_sheet_with_rows(sheet, [SHEET_HEADERS, *rows])
+        print(f"Wrote {len(results)} rows to Google Sheet: {SHEET_NAME}")
+        return
 
-    rows = [[r.get(f, "") for f in SHEET_FIELDS] for r in results]
+    # APPEND ONLY — never clear the sheet. values.append finds the next
+    # free row server-side, so the existing rows are never downloaded.
+    if not has_header_row(service):
+        rows.insert(0, SHEET_HEADERS)
     if rows:
-        sheet.values().update(
+        sheet.values().append(
             spreadsheetId=SPREADSHEET_ID,
-            range=f"'{SHEET_NAME}'!A{start_row}",
+            range=f"'{SHEET_NAME}'!A1",
             valueInputOption="RAW",
+            insertDataOption="INSERT_ROWS",
             body={"values": rows}
         ).execute()
 